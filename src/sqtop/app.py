@@ -2,21 +2,21 @@
 
 from __future__ import annotations
 
+import os
 from collections.abc import Iterable
 from pathlib import Path
 from textual.app import App, ComposeResult, SystemCommand
 from textual.binding import Binding
 from textual.css.query import NoMatches
 from textual.screen import Screen
+from textual.widget import Widget
 from textual.widgets import Footer, Header, TabbedContent, TabPane
 
-from .views.base import BaseDataTableView
+from .views.base import BaseDataTableView, RefreshRequested
 from .views.jobs import JobsView, COLUMNS as JOBS_COLUMNS
 from .views.nodes import NodesView, COLUMNS as NODES_COLUMNS
 from .views.partitions import PartitionsView, COLUMNS as PARTITIONS_COLUMNS
 from .views.history import HistoryView
-from .views.column_toggle import ColumnToggleScreen
-from .views.keybindings_help import KeybindingHelpScreen
 from . import config, slurm
 
 # (sort_key, human-readable label) — order determines palette display order
@@ -28,26 +28,49 @@ _JOBS_SORT_OPTIONS: list[tuple[str, str]] = [
     ("qos", "QOS"),
 ]
 
+# (seconds, label) for the refresh-interval palette commands.
+_INTERVAL_OPTIONS: list[tuple[float, str]] = [
+    (secs, f"{secs:.0f}s") for secs in (1.0, 2.0, 5.0, 10.0, 30.0)
+]
+
+_CSS_FILE = Path(__file__).parent / "styles" / "app.tcss"
+try:
+    _CSS_TEXT: str | None = _CSS_FILE.read_text(encoding="utf-8")
+except FileNotFoundError:
+    _CSS_TEXT = None
+# Textual's dev mode (TEXTUAL=debug,devtools) only live-reloads stylesheets given via CSS_PATH.
+_CSS_LIVE_RELOAD = "debug" in os.environ.get("TEXTUAL", "").split(",")
+
+_TAB_TABLE_IDS: dict[str, str] = {
+    "jobs": "#jobs-table",
+    "nodes": "#nodes-table",
+    "partitions": "#partitions-table",
+    "history": "#history-table",
+}
+
 
 class SqtopApp(App):
     """Slurm TUI dashboard."""
 
-    CSS_PATH = Path(__file__).parent / "styles" / "app.tcss"
+    if _CSS_TEXT is None or _CSS_LIVE_RELOAD:
+        CSS_PATH = _CSS_FILE
+    else:
+        CSS = _CSS_TEXT
 
-    BINDINGS = [
+    BINDINGS = (
         Binding("q", "quit", "Quit"),
         Binding("ctrl+c", "quit", "Quit", show=False),
-        Binding("1", "switch_tab('jobs')", "Jobs"),
-        Binding("2", "switch_tab('nodes')", "Nodes"),
-        Binding("3", "switch_tab('partitions')", "Partitions"),
-        Binding("4", "switch_tab('history')", "History"),
+        Binding("1", "switch_jobs", "Jobs"),
+        Binding("2", "switch_nodes", "Nodes"),
+        Binding("3", "switch_partitions", "Partitions"),
+        Binding("4", "switch_history", "History"),
         Binding("r", "refresh", "Refresh"),
         Binding("P", "toggle_pause", "Pause", show=False),
         Binding("S", "command_palette", "Commands", show=False),
         Binding("ctrl+p", "command_palette", "Commands", show=False),
         Binding("C", "column_toggle", "Columns", show=False),
         Binding("question_mark", "show_keybindings", "Keys", show=True),
-    ]
+    )
 
     TITLE = "sqtop"
 
@@ -60,11 +83,21 @@ class SqtopApp(App):
         self.expert_mode = bool(cfg.get("ui", {}).get("expert_mode", False))
         self.confirm_cancel_single = bool(cfg.get("safety", {}).get("confirm_cancel_single", True))
         self.confirm_bulk_actions = bool(cfg.get("safety", {}).get("confirm_bulk_actions", True))
+        # Widget refs captured once in compose()/on_mount; the layout is static afterwards.
+        self._tabs: TabbedContent | None = None
+        self._jobs_view: JobsView | None = None
+        self._nodes_view: NodesView | None = None
+        self._partitions_view: PartitionsView | None = None
+        self._views: tuple[BaseDataTableView, ...] = ()
+        self._tables: dict[str, Widget] = {}
+        # Created on the first screenshot rather than on every keypress.
+        self._screenshot_dir: str | None = None
 
     def watch_theme(self, theme: str) -> None:
         config.save(theme, self.interval)
 
     def on_mount(self) -> None:
+        self._tabs = self.query_one(TabbedContent)
         self.theme = self._saved_theme
         if slurm._SSH_HOST:
             self.sub_title = f"Slurm Dashboard — {slurm._SSH_HOST}"
@@ -72,41 +105,63 @@ class SqtopApp(App):
             self.sub_title = "Slurm Dashboard"
         self.call_after_refresh(self._focus_table_for_tab, "jobs")
 
+    def on_unmount(self) -> None:
+        config.flush()
+
     def compose(self) -> ComposeResult:
         yield Header()
         with TabbedContent(initial="jobs"):
+            self._jobs_view = JobsView(self.interval)
+            self._nodes_view = NodesView(self.interval, start_offset=0.7)
+            self._partitions_view = PartitionsView(self.interval, start_offset=1.4)
+            self._views = (self._jobs_view, self._nodes_view, self._partitions_view)
             with TabPane("Jobs [1]", id="jobs"):
-                yield JobsView(self.interval)
+                yield self._jobs_view
             with TabPane("Nodes [2]", id="nodes"):
-                yield NodesView(self.interval, start_offset=0.7)
+                yield self._nodes_view
             with TabPane("Partitions [3]", id="partitions"):
-                yield PartitionsView(self.interval, start_offset=1.4)
+                yield self._partitions_view
             with TabPane("History [4]", id="history"):
                 yield HistoryView(interval=30.0, start_offset=2.1)
         yield Footer()
 
     def action_switch_tab(self, tab_id: str) -> None:
-        self.query_one(TabbedContent).active = tab_id
+        self._tabs.active = tab_id
         self.call_after_refresh(self._focus_table_for_tab, tab_id)
 
+    def action_switch_jobs(self) -> None:
+        self.action_switch_tab("jobs")
+
+    def action_switch_nodes(self) -> None:
+        self.action_switch_tab("nodes")
+
+    def action_switch_partitions(self) -> None:
+        self.action_switch_tab("partitions")
+
+    def action_switch_history(self) -> None:
+        self.action_switch_tab("history")
+
     def _focus_table_for_tab(self, tab_id: str) -> None:
-        table_id = {
-            "jobs": "#jobs-table",
-            "nodes": "#nodes-table",
-            "partitions": "#partitions-table",
-            "history": "#history-table",
-        }.get(tab_id)
+        table_id = _TAB_TABLE_IDS.get(tab_id)
         if not table_id:
             return
         try:
-            self.query_one(table_id).focus()
+            table = self._tables.get(tab_id)
+            if table is None:
+                table = self._tables[tab_id] = self.query_one(table_id)
+            table.focus()
         except Exception:
             # Ignore focus races during startup/resizes.
             return
 
     def action_refresh(self) -> None:
-        for view in self.query("JobsView, NodesView, PartitionsView"):
-            view.refresh_data()  # type: ignore[union-attr]
+        """Ask every live view to refresh now.
+
+        Each view fetches in a thread worker and restarts its interval timer, so a
+        manual refresh replaces the upcoming tick instead of doubling up with it.
+        """
+        for view in self._views:
+            view.post_message(RefreshRequested())
 
     def action_toggle_pause(self) -> None:
         self._paused = not self._paused
@@ -118,23 +173,25 @@ class SqtopApp(App):
         self.notify("Paused" if self._paused else "Resumed", title="Refresh")
 
     def action_column_toggle(self) -> None:
-        active = self.query_one(TabbedContent).active
+        active = self._tabs.active
         cfg = config.load()
         if active == "jobs":
-            view = self.query_one(JobsView)
+            view = self._jobs_view
             all_cols = [name for name, _, _ in JOBS_COLUMNS]
             hidden = list(cfg.get("columns", {}).get("jobs_hidden", []))
         elif active == "nodes":
-            view = self.query_one(NodesView)
+            view = self._nodes_view
             all_cols = [name for name, _, _ in NODES_COLUMNS]
             hidden = list(cfg.get("columns", {}).get("nodes_hidden", []))
         elif active == "partitions":
-            view = self.query_one(PartitionsView)
+            view = self._partitions_view
             all_cols = [name for name, _ in PARTITIONS_COLUMNS]
             hidden = list(cfg.get("columns", {}).get("partitions_hidden", []))
         else:
             return
 
+        from .views.column_toggle import ColumnToggleScreen
+
         def _make_callback(v):
             return lambda _: v._reload_column_visibility()
 
@@ -144,7 +201,7 @@ class SqtopApp(App):
         pane_name = "Jobs"
         pane_bindings = list(JobsView.BINDINGS)
         try:
-            active = self.query_one(TabbedContent).active or "jobs"
+            active = self._tabs.active or "jobs"
         except Exception:
             active = "jobs"
         if active == "nodes":
@@ -153,13 +210,13 @@ class SqtopApp(App):
         elif active == "partitions":
             pane_name = "Partitions"
             pane_bindings = list(PartitionsView.BINDINGS)
+        from .views.keybindings_help import KeybindingHelpScreen
         self.push_screen(KeybindingHelpScreen(pane_name, list(self.BINDINGS), pane_bindings))
 
     def get_system_commands(self, screen: Screen) -> Iterable[SystemCommand]:
         yield from super().get_system_commands(screen)
         yield SystemCommand("Refresh data", "Refresh all views now", self.action_refresh)
-        for secs in [1.0, 2.0, 5.0, 10.0, 30.0]:
-            label = f"{secs:.0f}s"
+        for secs, label in _INTERVAL_OPTIONS:
             yield SystemCommand(
                 f"Set refresh: {label}",
                 f"Set auto-refresh interval to {label}",
@@ -237,10 +294,12 @@ class SqtopApp(App):
         )
 
     def action_save_screenshot(self) -> None:
-        screenshot_dir = Path.home() / ".cache" / "sqtop" / "screenshots"
-        screenshot_dir.mkdir(parents=True, exist_ok=True)
         try:
-            path = self.save_screenshot(path=str(screenshot_dir))
+            if self._screenshot_dir is None:
+                screenshot_dir = Path.home() / ".cache" / "sqtop" / "screenshots"
+                screenshot_dir.mkdir(parents=True, exist_ok=True)
+                self._screenshot_dir = str(screenshot_dir)
+            path = self.save_screenshot(path=self._screenshot_dir)
             self.notify(f"Saved screenshot: {path}", title="Screenshot")
         except Exception as exc:
             self.notify(f"Screenshot failed: {exc}", title="Screenshot", severity="error")
@@ -259,5 +318,5 @@ class SqtopApp(App):
 
     def set_refresh_interval(self, interval: float) -> None:
         self.interval = interval
-        for view in self.query("JobsView, NodesView, PartitionsView"):
-            view.set_interval_rate(interval)  # type: ignore[union-attr]
+        for view in self._views:
+            view.set_interval_rate(interval)
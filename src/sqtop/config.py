@@ -1,12 +1,29 @@
-"""Persistent configuration stored in ~/.config/sqtop/config.toml."""
+"""Persistent configuration stored in ~/.config/sqtop/config.toml (or $XDG_CONFIG_HOME/sqtop)."""
 from __future__ import annotations
 
+import asyncio
+import copy
+import os
+import threading
 import tomllib
 from pathlib import Path
 
-_CONFIG_DIR = Path.home() / ".config" / "sqtop"
+import tomli_w
+
+# Read $HOME directly so the common case skips the pwd lookup in Path.home().
+_HOME = os.environ.get("HOME") or os.path.expanduser("~")
+_CONFIG_DIR = Path(os.environ.get("XDG_CONFIG_HOME") or f"{_HOME}/.config") / "sqtop"
 _CONFIG_FILE = _CONFIG_DIR / "config.toml"
 
+# (path, mtime_ns, size) of the last parsed file and the merged config built from it.
+_CACHE: tuple[tuple[str, int, int], dict] | None = None
+
+# Overrides accepted by update()/save() but not yet written; flushed after _FLUSH_DELAY.
+_FLUSH_DELAY = 0.25
+_pending: dict | None = None
+_flush_handle: asyncio.TimerHandle | None = None
+_pending_lock = threading.Lock()
+
 _DEFAULTS: dict = {
     "theme": "dracula",
     "interval": 2.0,
@@ -58,201 +75,158 @@ _DEFAULTS: dict = {
 }
 
 
-def _defaults() -> dict:
-    return {
-        "theme": _DEFAULTS["theme"],
-        "interval": _DEFAULTS["interval"],
-        "jobs": dict(_DEFAULTS["jobs"]),
-        "attach": dict(_DEFAULTS["attach"]),
-        "ui": dict(_DEFAULTS["ui"]),
-        "safety": dict(_DEFAULTS["safety"]),
-        "health": dict(_DEFAULTS["health"]),
-        "view_state": dict(_DEFAULTS["view_state"]),
-        "columns": {k: list(v) for k, v in _DEFAULTS["columns"].items()},
-        "notifications": dict(_DEFAULTS["notifications"]),
-        "remote": dict(_DEFAULTS["remote"]),
-    }
+_NESTED = (
+    "jobs", "attach", "ui", "safety", "health",
+    "view_state", "columns", "notifications", "remote",
+)
+_NESTED_SET = frozenset(_NESTED)
 
 
-def _toml_escape(value: str) -> str:
-    return value.replace("\\", "\\\\").replace('"', '\\"')
+def _defaults() -> dict:
+    # Section dicts only hold scalars, so a shallow copy each is enough; the
+    # hidden-column lists are copied too so callers never alias _DEFAULTS.
+    cfg = {k: (v.copy() if isinstance(v, dict) else v) for k, v in _DEFAULTS.items()}
+    cfg["columns"] = {k: list(v) for k, v in _DEFAULTS["columns"].items()}
+    return cfg
 
 
 def load() -> dict:
-    """Return config dict, falling back to defaults on any error."""
-    if not _CONFIG_FILE.exists():
+    """Return config dict, falling back to defaults on any error.
+
+    The parsed result is cached and reused until the file's mtime or size changes;
+    callers always receive a deep copy they are free to mutate. Updates that are
+    still waiting for a debounced write are applied on top.
+    """
+    cfg = _load_file()
+    with _pending_lock:
+        if _pending:
+            _merge(cfg, copy.deepcopy(_pending))
+    return cfg
+
+
+def _load_file() -> dict:
+    global _CACHE
+    try:
+        f = _CONFIG_FILE.open("rb")
+    except FileNotFoundError:
         return _defaults()
     try:
-        with _CONFIG_FILE.open("rb") as f:
+        with f:
+            # Key the cache off the open handle so it describes exactly what we read.
+            st = os.fstat(f.fileno())
+            key = (str(_CONFIG_FILE), st.st_mtime_ns, st.st_size)
+            if _CACHE is not None and _CACHE[0] == key:
+                return copy.deepcopy(_CACHE[1])
             data = tomllib.load(f)
         cfg = _defaults()
-        nested_keys = {"jobs", "attach", "ui", "safety", "health", "view_state", "columns", "notifications", "remote"}
-        cfg.update({k: v for k, v in data.items() if k not in nested_keys})
-        jobs = dict(_DEFAULTS["jobs"])
-        if isinstance(data.get("jobs"), dict):
-            jobs.update(data["jobs"])
-        cfg["jobs"] = jobs
-        attach = dict(_DEFAULTS["attach"])
-        if isinstance(data.get("attach"), dict):
-            attach.update(data["attach"])
-        cfg["attach"] = attach
-        ui = dict(_DEFAULTS["ui"])
-        if isinstance(data.get("ui"), dict):
-            ui.update(data["ui"])
-        cfg["ui"] = ui
-        safety = dict(_DEFAULTS["safety"])
-        if isinstance(data.get("safety"), dict):
-            safety.update(data["safety"])
-        cfg["safety"] = safety
-        health = dict(_DEFAULTS["health"])
-        if isinstance(data.get("health"), dict):
-            health.update(data["health"])
-        cfg["health"] = health
-        view_state = dict(_DEFAULTS["view_state"])
-        if isinstance(data.get("view_state"), dict):
-            view_state.update(data["view_state"])
-        cfg["view_state"] = view_state
-        columns = {k: list(v) for k, v in _DEFAULTS["columns"].items()}
-        if isinstance(data.get("columns"), dict):
-            for k, v in data["columns"].items():
-                if isinstance(v, list):
-                    columns[k] = v
-        cfg["columns"] = columns
-        notifications = dict(_DEFAULTS["notifications"])
-        if isinstance(data.get("notifications"), dict):
-            notifications.update(data["notifications"])
-        cfg["notifications"] = notifications
-        remote = dict(_DEFAULTS["remote"])
-        if isinstance(data.get("remote"), dict):
-            remote.update(data["remote"])
-        cfg["remote"] = remote
-        return cfg
+        for k, v in data.items():
+            if k not in _NESTED_SET:
+                cfg[k] = v
+        for section in _NESTED:
+            src = data.get(section)
+            if not isinstance(src, dict):
+                continue
+            if section == "columns":
+                # Only list-valued entries are meaningful hidden-column lists.
+                cfg[section].update((k, v) for k, v in src.items() if isinstance(v, list))
+            else:
+                cfg[section].update(src)
     except Exception:
         return _defaults()
+    _CACHE = (key, cfg)
+    return copy.deepcopy(cfg)
 
 
 def save(theme: str, interval: float) -> None:
     """Persist theme/interval while preserving other settings."""
-    cfg = load()
-    cfg["theme"] = theme
-    cfg["interval"] = interval
-    _write(cfg)
+    update({"theme": theme, "interval": interval})
 
 
 def update(overrides: dict) -> None:
-    """Update config with shallow+section merge and persist."""
-    cfg = load()
+    """Update config with shallow+section merge and persist.
+
+    Inside a running event loop the write is deferred by _FLUSH_DELAY so a burst
+    of updates costs a single write; otherwise it happens immediately.
+    """
+    global _pending
+    with _pending_lock:
+        _pending = _merge(_pending or {}, copy.deepcopy(overrides))
+    _schedule_flush()
+
+
+def flush() -> None:
+    """Write any pending updates now."""
+    global _pending, _flush_handle
+    with _pending_lock:
+        if _flush_handle is not None:
+            _flush_handle.cancel()
+            _flush_handle = None
+        pending, _pending = _pending, None
+        if pending is None:
+            return
+        _write(_merge(_load_file(), pending))
+
+
+def _schedule_flush() -> None:
+    global _flush_handle
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        flush()
+        return
+    with _pending_lock:
+        if _flush_handle is None:
+            _flush_handle = loop.call_later(_FLUSH_DELAY, flush)
+
+
+def _merge(cfg: dict, overrides: dict) -> dict:
     for key, value in overrides.items():
         if isinstance(value, dict) and isinstance(cfg.get(key), dict):
             cfg[key] = {**cfg[key], **value}
         else:
             cfg[key] = value
-    _write(cfg)
+    return cfg
 
 
-def _toml_str_list(lst: list) -> str:
-    return "[" + ", ".join(f'"{x}"' for x in lst) + "]"
+def _coerce(default, value):
+    """Cast value to the type of its default; list entries are stringified."""
+    if isinstance(default, list):
+        return [str(x) for x in value]
+    return type(default)(value)
 
 
 def _write(cfg: dict) -> None:
-    jobs = cfg.get("jobs", {})
-    attach = cfg.get("attach", {})
-    ui = cfg.get("ui", {})
-    safety = cfg.get("safety", {})
-    health = cfg.get("health", {})
-    view_state = cfg.get("view_state", {})
-    columns = cfg.get("columns", {})
-    notifications = cfg.get("notifications", {})
-    remote = cfg.get("remote", {})
-
-    enabled = bool(attach.get("enabled", _DEFAULTS["attach"]["enabled"]))
-    default_command = str(attach.get("default_command", _DEFAULTS["attach"]["default_command"]))
-    extra_args = str(attach.get("extra_args", _DEFAULTS["attach"]["extra_args"]))
-    expert_mode = bool(ui.get("expert_mode", _DEFAULTS["ui"]["expert_mode"]))
-    show_palette_hints = bool(ui.get("show_palette_hints", _DEFAULTS["ui"]["show_palette_hints"]))
-    confirm_cancel_single = bool(
-        safety.get("confirm_cancel_single", _DEFAULTS["safety"]["confirm_cancel_single"])
-    )
-    confirm_bulk_actions = bool(
-        safety.get("confirm_bulk_actions", _DEFAULTS["safety"]["confirm_bulk_actions"])
-    )
-    health_enabled = bool(health.get("enabled", _DEFAULTS["health"]["enabled"]))
-    history_size = int(health.get("history_size", _DEFAULTS["health"]["history_size"]))
-    warn_pending_ratio = float(
-        health.get("warn_pending_ratio", _DEFAULTS["health"]["warn_pending_ratio"])
-    )
-    warn_down_nodes = int(health.get("warn_down_nodes", _DEFAULTS["health"]["warn_down_nodes"]))
-
-    theme = str(cfg.get("theme", _DEFAULTS["theme"]))
-    interval = float(cfg.get("interval", _DEFAULTS["interval"]))
-
-    jobs_sort_col = str(view_state.get("jobs_sort_col", _DEFAULTS["view_state"]["jobs_sort_col"]))
-    jobs_sort_reversed = bool(view_state.get("jobs_sort_reversed", _DEFAULTS["view_state"]["jobs_sort_reversed"]))
-    nodes_sort_col = str(view_state.get("nodes_sort_col", _DEFAULTS["view_state"]["nodes_sort_col"]))
-    nodes_sort_reversed = bool(view_state.get("nodes_sort_reversed", _DEFAULTS["view_state"]["nodes_sort_reversed"]))
-    partitions_sort_col = str(view_state.get("partitions_sort_col", _DEFAULTS["view_state"]["partitions_sort_col"]))
-    partitions_sort_reversed = bool(view_state.get("partitions_sort_reversed", _DEFAULTS["view_state"]["partitions_sort_reversed"]))
-
-    jobs_hidden = list(columns.get("jobs_hidden", []))
-    nodes_hidden = list(columns.get("nodes_hidden", []))
-    partitions_hidden = list(columns.get("partitions_hidden", []))
-
-    desktop_enabled = bool(notifications.get("desktop_enabled", _DEFAULTS["notifications"]["desktop_enabled"]))
-
-    remote_host = str(remote.get("host", _DEFAULTS["remote"]["host"]))
+    global _CACHE
+    # Only keys present in _DEFAULTS are written, each cast to its default's type.
+    doc = {
+        k: _coerce(default, cfg.get(k, default))
+        for k, default in _DEFAULTS.items()
+        if k not in _NESTED_SET
+    }
+    for section in _NESTED:
+        merged = {**_DEFAULTS[section], **cfg.get(section, {})}
+        doc[section] = {k: _coerce(default, merged[k]) for k, default in _DEFAULTS[section].items()}
 
+    payload = tomli_w.dumps(doc).encode("utf-8")
     _CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    lines = [
-        f'theme = "{theme}"',
-        f"interval = {interval}",
-        "",
-        "[jobs]",
-        f'name_max = {int(jobs.get("name_max", _DEFAULTS["jobs"]["name_max"]))}',
-        f'user_max = {int(jobs.get("user_max", _DEFAULTS["jobs"]["user_max"]))}',
-        f'partition_max = {int(jobs.get("partition_max", _DEFAULTS["jobs"]["partition_max"]))}',
-        (
-            "nodelist_reason_max = "
-            f'{int(jobs.get("nodelist_reason_max", _DEFAULTS["jobs"]["nodelist_reason_max"]))}'
-        ),
-        f'qos_max = {int(jobs.get("qos_max", _DEFAULTS["jobs"]["qos_max"]))}',
-        "",
-        "[attach]",
-        f'enabled = {"true" if enabled else "false"}',
-        f'default_command = "{_toml_escape(default_command)}"',
-        f'extra_args = "{_toml_escape(extra_args)}"',
-        "",
-        "[ui]",
-        f'expert_mode = {"true" if expert_mode else "false"}',
-        f'show_palette_hints = {"true" if show_palette_hints else "false"}',
-        "",
-        "[safety]",
-        f'confirm_cancel_single = {"true" if confirm_cancel_single else "false"}',
-        f'confirm_bulk_actions = {"true" if confirm_bulk_actions else "false"}',
-        "",
-        "[health]",
-        f'enabled = {"true" if health_enabled else "false"}',
-        f"history_size = {history_size}",
-        f"warn_pending_ratio = {warn_pending_ratio}",
-        f"warn_down_nodes = {warn_down_nodes}",
-        "",
-        "[view_state]",
-        f'jobs_sort_col = "{_toml_escape(jobs_sort_col)}"',
-        f'jobs_sort_reversed = {"true" if jobs_sort_reversed else "false"}',
-        f'nodes_sort_col = "{_toml_escape(nodes_sort_col)}"',
-        f'nodes_sort_reversed = {"true" if nodes_sort_reversed else "false"}',
-        f'partitions_sort_col = "{_toml_escape(partitions_sort_col)}"',
-        f'partitions_sort_reversed = {"true" if partitions_sort_reversed else "false"}',
-        "",
-        "[columns]",
-        f"jobs_hidden = {_toml_str_list(jobs_hidden)}",
-        f"nodes_hidden = {_toml_str_list(nodes_hidden)}",
-        f"partitions_hidden = {_toml_str_list(partitions_hidden)}",
-        "",
-        "[notifications]",
-        f'desktop_enabled = {"true" if desktop_enabled else "false"}',
-        "",
-        "[remote]",
-        f'host = "{_toml_escape(remote_host)}"',
-        "",
-    ]
-    _CONFIG_FILE.write_text("\n".join(lines), encoding="utf-8")
+    # Write a sibling temp file and swap it in so readers never see a partial file.
+    tmp = _CONFIG_FILE.with_suffix(".toml.tmp")
+    try:
+        mode = _CONFIG_FILE.stat().st_mode & 0o7777
+    except OSError:
+        mode = None  # first write: keep the umask default
+    try:
+        with open(tmp, "wb") as f:
+            f.write(payload)
+            f.flush()
+            if mode is not None:
+                os.fchmod(f.fileno(), mode)  # keep the user's chmod on config.toml
+            os.fsync(f.fileno())
+            st = os.fstat(f.fileno())
+        os.replace(tmp, _CONFIG_FILE)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    # doc holds every default key, so it is exactly what load() would parse back;
+    # the rename keeps the temp file's mtime/size, so the next load() is a cache hit.
+    _CACHE = ((str(_CONFIG_FILE), st.st_mtime_ns, st.st_size), doc)
@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+import os
 import re
 import subprocess
 import shlex
+import tempfile
+import threading
 from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import count, islice
+from sys import intern
 from collections import deque
+from collections.abc import Iterator
 from time import monotonic
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandStat:
     command: str
     ok: bool
@@ -19,7 +26,7 @@ class CommandStat:
     stderr: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionResult:
     job_id: str
     action: str
@@ -34,51 +41,169 @@ def _record_command(command: str, ok: bool, latency_ms: int, stderr: str = "") -
     _COMMAND_HISTORY.append(CommandStat(command=command, ok=ok, latency_ms=latency_ms, stderr=stderr))
 
 
-def _run_result(cmd: str) -> tuple[str, bool, str]:
-    """Run command and return (stdout, ok, stderr)."""
+# Commands are either a shell-style string or a prebuilt argv list; the list form
+# skips shlex tokenizing for the fixed commands run on every refresh.
+Command = str | list[str]
+
+
+def _command_text(cmd: Command) -> str:
+    return cmd if isinstance(cmd, str) else shlex.join(cmd)
+
+
+def _command_argv(cmd: Command) -> list[str]:
+    """Return argv for cmd, wrapped in ssh when a remote host is configured."""
+    if _SSH_HOST:
+        ssh = ["ssh", "-q", "-o", "BatchMode=yes", "-o", "ConnectTimeout=8"]
+        if _SSH_KEY:
+            ssh += ["-i", _SSH_KEY]
+        return ssh + [_SSH_HOST, _command_text(cmd)]  # single string → remote shell parses it
+    return shlex.split(cmd) if isinstance(cmd, str) else cmd
+
+
+# Failure reasons recorded in the command history. Kept distinct: a timed-out
+# command may already have acted, one that failed to launch did nothing.
+_TIMEOUT = "timeout"
+_NOT_FOUND = "command not found"
+
+
+# Slurm output is decoded as UTF-8 regardless of locale; stray bytes in job names
+# or paths become U+FFFD instead of raising UnicodeDecodeError mid-refresh.
+# stdin is /dev/null so children (notably ssh) never read the TUI's terminal.
+def _run_command(cmd: Command, record: bool = True) -> tuple[str, bool, str] | None:
+    """Run command and return (stdout, ok, stderr), or None if it could not be launched.
+
+    Failures are always recorded in the command history; successes only when
+    record is true.
+    """
     start = monotonic()
     try:
-        if _SSH_HOST:
-            ssh = ["ssh", "-q", "-o", "BatchMode=yes", "-o", "ConnectTimeout=8"]
-            if _SSH_KEY:
-                ssh += ["-i", _SSH_KEY]
-            cmd_list = ssh + [_SSH_HOST, cmd]  # cmd as single string → remote shell parses it
-        else:
-            cmd_list = shlex.split(cmd)
         result = subprocess.run(
-            cmd_list,
+            _command_argv(cmd),
+            stdin=subprocess.DEVNULL,
             capture_output=True,
-            text=True,
+            encoding="utf-8",
+            errors="replace",
             timeout=10,
         )
-        ok = result.returncode == 0
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError) as exc:
+        launched = isinstance(exc, subprocess.TimeoutExpired)
         _record_command(
-            cmd,
-            ok=ok,
+            _command_text(cmd),
+            ok=False,
             latency_ms=int((monotonic() - start) * 1000),
-            stderr=(result.stderr or "").strip(),
+            stderr=_TIMEOUT if launched else _NOT_FOUND,
         )
-        return result.stdout, ok, (result.stderr or "").strip()
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return ("", False, _TIMEOUT) if launched else None
+    ok = result.returncode == 0
+    stderr = (result.stderr or "").strip()
+    if record or not ok:
         _record_command(
-            cmd,
-            ok=False,
+            _command_text(cmd),
+            ok=ok,
             latency_ms=int((monotonic() - start) * 1000),
-            stderr="timeout or command not found",
+            stderr=stderr,
         )
-        return "", False, "timeout or command not found"
+    return result.stdout, ok, stderr
+
+
+def _run_result(cmd: Command) -> tuple[str, bool, str]:
+    """Run command and return (stdout, ok, stderr)."""
+    return _run_command(cmd) or ("", False, _NOT_FOUND)
 
 
-def _run(cmd: str) -> str:
+def _run(cmd: Command) -> str:
     out, _, _ = _run_result(cmd)
     return out
 
 
+# The refresh loop runs sinfo/scontrol every few seconds; recording each call would
+# churn the health history with near-identical entries. Failures are always kept.
+_FAST_SAMPLE_EVERY = 10
+_fast_calls = count()
+
+
+def _run_fast(cmd: Command) -> str:
+    """Run a periodic fetch command and return stdout.
+
+    Like _run, but only failures and every _FAST_SAMPLE_EVERY-th call are
+    recorded in the command history.
+    """
+    result = _run_command(cmd, record=next(_fast_calls) % _FAST_SAMPLE_EVERY == 0)
+    return result[0] if result is not None else ""
+
+
+def _run_lines(cmd: Command) -> Iterator[str]:
+    """Run command and yield stdout lines as they arrive.
+
+    Avoids holding the whole output as one string for large listings. The process
+    is killed after the same 10s budget _run_result uses. stderr goes to a temp
+    file so a chatty child can't fill the pipe and stall. If the output was cut
+    short (killed or nonzero exit) CalledProcessError is raised once stdout is
+    exhausted, so callers can drop the partial listing.
+    """
+    start = monotonic()
+    try:
+        err_file = tempfile.TemporaryFile()
+    except OSError:
+        err_file = subprocess.DEVNULL
+    try:
+        proc = subprocess.Popen(
+            _command_argv(cmd),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=err_file,
+            encoding="utf-8",
+            errors="replace",
+        )
+    except OSError:
+        if err_file is not subprocess.DEVNULL:
+            err_file.close()
+        _record_command(
+            _command_text(cmd),
+            ok=False,
+            latency_ms=int((monotonic() - start) * 1000),
+            stderr=_NOT_FOUND,
+        )
+        return
+    timed_out = threading.Event()
+
+    def expire() -> None:
+        timed_out.set()
+        proc.kill()
+
+    killer = threading.Timer(10, expire)
+    killer.start()
+    finished = False
+    try:
+        yield from proc.stdout
+        finished = True
+    finally:
+        killer.cancel()
+        if not finished:
+            proc.kill()  # consumer stopped early
+        proc.stdout.close()
+        returncode = proc.wait()
+        stderr = ""
+        if err_file is not subprocess.DEVNULL:
+            err_file.seek(0)
+            stderr = err_file.read().decode("utf-8", "replace").strip()
+            err_file.close()
+        if finished:  # a consumer that stopped early isn't a command failure
+            _record_command(
+                _command_text(cmd),
+                ok=returncode == 0,
+                latency_ms=int((monotonic() - start) * 1000),
+                stderr=_TIMEOUT if timed_out.is_set() else stderr,
+            )
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, _command_text(cmd), stderr=stderr)
+
+
 # ---------------------------------------------------------------------------
 # Jobs (squeue)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     job_id: str
     name: str
@@ -93,34 +218,32 @@ class Job:
     reason: str = ""
     nodelist: str = ""
     qos: str = ""
+    # int(job_id) for plain numeric ids, else 0; parsed once here for the sort keys.
+    numeric_id: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.numeric_id = int(self.job_id) if self.job_id.isdigit() else 0
 
 
 def fetch_jobs() -> list[Job]:
     """Return jobs from squeue -o with parseable format."""
     fmt = "%i|%j|%u|%T|%P|%D|%C|%M|%l|%R|%N|%q"
-    out = _run(f"squeue --noheader -o '{fmt}'")
     jobs = []
-    for line in out.strip().splitlines():
-        parts = line.split("|")
-        if len(parts) < 12:
-            continue
-        qos_raw = parts[11]
-        qos = "" if qos_raw in ("N/A", "(null)") else qos_raw
-        jobs.append(Job(
-            job_id=parts[0],
-            name=parts[1],
-            user=parts[2],
-            state=parts[3],
-            partition=parts[4],
-            nodes=parts[5],
-            num_cpus=parts[6],
-            time_used=parts[7],
-            time_limit=parts[8],
-            reason=parts[9],
-            nodelist=parts[10],
-            num_nodes=parts[5],
-            qos=qos,
-        ))
+    try:
+        for line in _run_lines(["squeue", "--noheader", "-o", fmt]):
+            parts = line.rstrip("\n").split("|", 11)
+            if len(parts) < 12:
+                continue
+            qos_raw = parts[11]
+            qos = "" if qos_raw in ("N/A", "(null)") else intern(qos_raw)
+            # Job field order is the squeue format with %D repeated for num_nodes.
+            # user/state/partition repeat across thousands of rows, so share one str each.
+            jobs.append(Job(
+                parts[0], parts[1], intern(parts[2]), intern(parts[3]), intern(parts[4]),
+                parts[5], parts[5], *parts[6:11], qos,
+            ))
+    except subprocess.CalledProcessError:
+        return []  # killed or failed part-way; a partial queue would read as complete
     return jobs
 
 
@@ -128,13 +251,20 @@ def fetch_jobs() -> list[Job]:
 # Nodes (sinfo)
 # ---------------------------------------------------------------------------
 
+_GPU_RE = re.compile(r'\bgpu:(?:[^:,()\s]+:)?(\d+)')
+_ALLOC_TRES_GPU_RE = re.compile(r'\bAllocTRES=\S*?\bgres/gpu=(\d+)')
+_GRES_USED_RE = re.compile(r'\bGresUsed=(\S*)')
+
+
+# Node GRES strings repeat across a cluster, so each distinct one is parsed once.
+@lru_cache(maxsize=256)
 def _parse_gpu_count(gres_str: str) -> int:
     """Extract GPU count from strings like 'gpu:4', 'gpu:a100:4', 'gpu:a100:4(IDX:0,1)'."""
-    m = re.search(r'\bgpu:(?:[^:,()\s]+:)?(\d+)', gres_str)
+    m = _GPU_RE.search(gres_str)
     return int(m.group(1)) if m else 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     name: str
     state: str       # idle, allocated, mixed, down, drain, ...
@@ -154,46 +284,65 @@ def _fetch_gpus_alloc() -> dict[str, int]:
     Reads AllocTRES (present in Slurm 24.x) and falls back to GresUsed
     (older Slurm versions) so both are handled.
     """
-    out = _run("scontrol show nodes")
+    out = _run_fast(["scontrol", "show", "nodes"])
     result: dict[str, int] = {}
-    node_name = ""
-    for token in out.split():
-        if token.startswith("NodeName="):
-            node_name = token.partition("=")[2]
-        elif token.startswith("AllocTRES=") and node_name:
-            # AllocTRES=cpu=64,mem=256G,gres/gpu=8
-            # gres/gpu= (no colon) is the bare aggregate count
-            m = re.search(r'gres/gpu=(\d+)', token.partition("=")[2])
-            if m:
-                result[node_name] = int(m.group(1))
-        elif token.startswith("GresUsed=") and node_name:
-            # Older Slurm: GresUsed=gpu:a100:4(IDX:0,1,2,3)
-            if node_name not in result:
-                result[node_name] = _parse_gpu_count(token.partition("=")[2])
+    # Each node's fields (one line or several indented ones) follow its NodeName=.
+    for block in out.split("NodeName=")[1:]:
+        fields = block.split(maxsplit=1)
+        if not fields:
+            continue
+        node_name, rest = fields[0], (fields[1] if len(fields) > 1 else "")
+        # AllocTRES=cpu=64,mem=256G,gres/gpu=8 — gres/gpu= (no colon) is the bare aggregate count
+        m = _ALLOC_TRES_GPU_RE.search(rest)
+        if m:
+            result[node_name] = int(m.group(1))
+            continue
+        # Older Slurm: GresUsed=gpu:a100:4(IDX:0,1,2,3)
+        m = _GRES_USED_RE.search(rest)
+        if m:
+            result[node_name] = _parse_gpu_count(m.group(1))
     return result
 
 
+# One per-node sinfo listing serves both the nodes and partitions views; the
+# trailing %a/%l/%D/%N fields are only needed for the partition summary.
+_SINFO_FMT = "%n|%T|%P|%c|%C|%m|%e|%O|%G|%a|%l|%D|%N"
+_SINFO_TTL = 1.0
+_SINFO_CACHE: tuple[float, list[list[str]]] | None = None
+_SINFO_LOCK = threading.Lock()
+
+
+def _fetch_sinfo_rows() -> list[list[str]]:
+    """Return split sinfo rows, reusing a result younger than _SINFO_TTL seconds."""
+    global _SINFO_CACHE
+    with _SINFO_LOCK:
+        if _SINFO_CACHE is not None and monotonic() - _SINFO_CACHE[0] < _SINFO_TTL:
+            return _SINFO_CACHE[1]
+        out = _run_fast(["sinfo", "--noheader", "-o", _SINFO_FMT])
+        rows = [line.split("|", 12) for line in out.strip().splitlines()]
+        _SINFO_CACHE = (monotonic(), rows)
+        return rows
+
+
 def fetch_nodes() -> list[Node]:
     """Return node info from sinfo."""
-    fmt = "%n|%T|%P|%c|%C|%m|%e|%O|%G"
     with ThreadPoolExecutor(max_workers=2) as pool:
-        f_sinfo = pool.submit(_run, f"sinfo --noheader -o '{fmt}'")
+        f_sinfo = pool.submit(_fetch_sinfo_rows)
         f_gpus  = pool.submit(_fetch_gpus_alloc)
-    out = f_sinfo.result()
+    rows = f_sinfo.result()
     gpus_alloc = f_gpus.result()
     nodes = []
-    for line in out.strip().splitlines():
-        parts = line.split("|")
-        if len(parts) < 9:
-            continue
+    for parts in rows:
+        if len(parts) < 9 or parts[11:12] == ["0"]:
+            continue  # a partition with no nodes has a row but no node
         # %C = allocated/idle/other/total  e.g. "2/6/0/8"
         cpu_parts = parts[4].split("/")
         gpu_total = _parse_gpu_count(parts[8])
         name = parts[0]
         nodes.append(Node(
             name=name,
-            state=parts[1],
-            partition=parts[2],
+            state=intern(parts[1]),
+            partition=intern(parts[2]),
             cpus_total=cpu_parts[3] if len(cpu_parts) == 4 else "?",
             cpus_alloc=cpu_parts[0] if len(cpu_parts) == 4 else "?",
             memory_total=parts[5],
@@ -209,7 +358,7 @@ def fetch_nodes() -> list[Node]:
 # Cluster summary (sinfo -s)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ClusterSummary:
     partition: str
     avail: str
@@ -219,15 +368,90 @@ class ClusterSummary:
     nodelist: str
 
 
+_HOST_NUM_RE = re.compile(r"^(.*?)(\d+)$")
+
+
+def _compress_hostlist(names: list[str]) -> str:
+    """Fold host names into Slurm's compressed form, e.g. node[01-03,07],login."""
+    # (name, False) marks a host without a numeric suffix; it is emitted verbatim.
+    groups: dict[tuple[str, bool], list[str]] = {}
+    for name in names:
+        m = _HOST_NUM_RE.match(name)
+        if m:
+            groups.setdefault((m.group(1), True), []).append(m.group(2))
+        else:
+            groups.setdefault((name, False), [])
+    parts = []
+    for (prefix, numeric), digit_strs in groups.items():
+        if not numeric:
+            parts.append(prefix)
+            continue
+        width = max((len(d) for d in digit_strs if d.startswith("0")), default=0)
+        nums = sorted({int(d) for d in digit_strs})
+        if len(nums) == 1:
+            parts.append(f"{prefix}{nums[0]:0{width}d}")
+            continue
+        ranges = []
+        start = prev = nums[0]
+        for n in nums[1:] + [None]:
+            if n is not None and n == prev + 1:
+                prev = n
+                continue
+            ranges.append(f"{start:0{width}d}" if start == prev else f"{start:0{width}d}-{prev:0{width}d}")
+            if n is not None:
+                start = prev = n
+        parts.append(f"{prefix}[{','.join(ranges)}]")
+    return ",".join(parts)
+
+
+_HOSTLIST_PART_RE = re.compile(r"[^,\[]+(?:\[[^\]]*\][^,\[]*)*")
+_HOST_RANGE_RE = re.compile(r"^([^\[]*)\[([\d,-]+)\]$")
+
+
+def _expand_hostlist(hostlist: str) -> list[str]:
+    """Expand a compressed hostlist like node[01-02,05],login into host names.
+
+    Forms other than a single trailing bracket group are kept verbatim.
+    """
+    names = []
+    for part in _HOSTLIST_PART_RE.findall(hostlist):
+        m = _HOST_RANGE_RE.match(part)
+        if not m:
+            names.append(part)
+            continue
+        prefix = m.group(1)
+        for span in m.group(2).split(","):
+            lo, _, hi = span.partition("-")
+            if not lo.isdigit() or (hi and not hi.isdigit()):
+                names.append(part)
+                break
+            width = len(lo)
+            names.extend(f"{prefix}{n:0{width}d}" for n in range(int(lo), int(hi or lo) + 1))
+    return names
+
+
 def fetch_cluster_summary() -> list[ClusterSummary]:
-    fmt = "%P|%a|%l|%D|%T|%N"
-    out = _run(f"sinfo --noheader -o '{fmt}'")
-    summaries = []
-    for line in out.strip().splitlines():
-        parts = line.split("|")
-        if len(parts) < 6:
+    """Group the per-node sinfo rows into sinfo's default partition/state summary."""
+    # Both keyed by (partition, avail, timelimit, state), in first-seen order.
+    counts: dict[tuple[str, str, str, str], int] = {}
+    groups: dict[tuple[str, str, str, str], dict[str, None]] = {}
+    for parts in _fetch_sinfo_rows():
+        if len(parts) < 13:
             continue
-        summaries.append(ClusterSummary(*parts[:6]))
+        key = (parts[2], parts[9], parts[10], parts[1])
+        # sinfo still merges nodes with identical fields, so a row can carry
+        # several (%D) nodes and an already compressed %N. Empty partitions
+        # report %D=0 and keep their row with no nodes.
+        counts[key] = counts.get(key, 0) + (int(parts[11]) if parts[11].isdigit() else 0)
+        names = groups.setdefault(key, {})
+        if parts[11] != "0":
+            names.update(dict.fromkeys(_expand_hostlist(parts[12])))
+    summaries = []
+    for key, names in groups.items():
+        partition, avail, timelimit, state = key
+        summaries.append(ClusterSummary(
+            partition, avail, timelimit, str(counts[key]), state, _compress_hostlist(list(names)),
+        ))
     return summaries
 
 
@@ -235,26 +459,50 @@ def fetch_cluster_summary() -> list[ClusterSummary]:
 # scontrol show job <id>
 # ---------------------------------------------------------------------------
 
-def fetch_job_detail(job_id: str) -> dict[str, str]:
-    """Return key=value pairs from scontrol show job <id>."""
-    out = _run(f"scontrol show job {job_id}")
+# scontrol show job/node results, keyed by (kind, id). Opening a job's log or info
+# screen tends to ask for the same record several times within a second or two.
+_DETAIL_TTL = 2.0
+_DETAIL_CACHE: dict[tuple[str, str], tuple[float, dict[str, str]]] = {}
+_DETAIL_LOCK = threading.Lock()
+
+
+def _fetch_detail(kind: str, ident: str) -> dict[str, str]:
+    key = (kind, ident)
+    with _DETAIL_LOCK:
+        hit = _DETAIL_CACHE.get(key)
+    if hit is not None and monotonic() - hit[0] < _DETAIL_TTL:
+        return dict(hit[1])
+    out = _run(["scontrol", "show", kind, ident])
     result: dict[str, str] = {}
     for token in out.split():
         if "=" in token:
             k, _, v = token.partition("=")
             result[k] = v
-    return result
+    if not result:
+        return result  # failed lookup; let the next call retry
+    now = monotonic()
+    with _DETAIL_LOCK:
+        if len(_DETAIL_CACHE) >= 64:
+            for stale in [k for k, (ts, _) in _DETAIL_CACHE.items() if now - ts >= _DETAIL_TTL]:
+                del _DETAIL_CACHE[stale]
+        _DETAIL_CACHE[key] = (now, result)
+    return dict(result)
+
+
+def invalidate_job_detail(job_id: str) -> None:
+    """Drop any cached scontrol show job result for job_id."""
+    with _DETAIL_LOCK:
+        _DETAIL_CACHE.pop(("job", job_id), None)
+
+
+def fetch_job_detail(job_id: str) -> dict[str, str]:
+    """Return key=value pairs from scontrol show job <id>."""
+    return _fetch_detail("job", job_id)
 
 
 def fetch_node_detail(node_name: str) -> dict[str, str]:
     """Return key=value pairs from scontrol show node <name>."""
-    out = _run(f"scontrol show node {node_name}")
-    result: dict[str, str] = {}
-    for token in out.split():
-        if "=" in token:
-            k, _, v = token.partition("=")
-            result[k] = v
-    return result
+    return _fetch_detail("node", node_name)
 
 
 def fetch_batch_script(job_id: str) -> str:
@@ -282,45 +530,85 @@ def cancel_job(job_id: str) -> bool:
 def cancel_job_result(job_id: str) -> tuple[bool, str]:
     """Run scancel and return (ok, stderr)."""
     _, ok, stderr = _run_result(f"scancel {shlex.quote(job_id)}")
+    invalidate_job_detail(job_id)
     return ok, stderr
 
 
 def hold_job_result(job_id: str) -> tuple[bool, str]:
     """Run scontrol hold and return (ok, stderr)."""
     _, ok, stderr = _run_result(f"scontrol hold {shlex.quote(job_id)}")
+    invalidate_job_detail(job_id)
     return ok, stderr
 
 
 def release_job_result(job_id: str) -> tuple[bool, str]:
     """Run scontrol release and return (ok, stderr)."""
     _, ok, stderr = _run_result(f"scontrol release {shlex.quote(job_id)}")
+    invalidate_job_detail(job_id)
     return ok, stderr
 
 
 def requeue_job_result(job_id: str) -> tuple[bool, str]:
     """Run scontrol requeue and return (ok, stderr)."""
     _, ok, stderr = _run_result(f"scontrol requeue {shlex.quote(job_id)}")
+    invalidate_job_detail(job_id)
     return ok, stderr
 
 
+def _tail_local(path: str, n: int) -> str:
+    """Return the last n lines of a local file by reading backwards from the end."""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        window = max(n * 200, 8192)
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            lines = f.read(size - start).splitlines(keepends=True)
+            # Past the start of the file the first line may be cut, so want n + 1.
+            if start == 0 or len(lines) > n:
+                break
+            window *= 4
+    return b"".join(lines[-n:]).decode("utf-8", "replace")
+
+
 def tail_log_file(path: str, n: int = 200) -> str:
-    """Return last n lines of a log file inside the slurmctld container."""
+    """Return last n lines of a job log file.
+
+    Local files are read in-process; remote (--remote) or unreadable paths go
+    through `tail` so the path is resolved where the job ran.
+    """
     if not path:
         return "(no log path)"
-    result = _run(f"tail -n {n} {shlex.quote(path)}")
+    result = None
+    if not _SSH_HOST:
+        try:
+            result = _tail_local(path, n)
+        except OSError:
+            pass
+    if result is None:
+        result = _run(f"tail -n {n} {shlex.quote(path)}")
     return result if result else "(empty or file not found)"
 
 
+# Hostlist expansion is deterministic, so successful lookups are kept for the session.
+_FIRST_NODE_CACHE: dict[str, str] = {}
+
+
 def resolve_first_node(nodelist_expr: str) -> str:
     """Resolve the first node hostname from a Slurm NodeList expression."""
     expr = (nodelist_expr or "").strip()
     if not expr or expr == "(null)":
         return ""
+    if expr in _FIRST_NODE_CACHE:
+        return _FIRST_NODE_CACHE[expr]
 
     out = _run(f"scontrol show hostnames {shlex.quote(expr)}")
     for line in out.splitlines():
         host = line.strip()
         if host:
+            if len(_FIRST_NODE_CACHE) >= 256:
+                _FIRST_NODE_CACHE.clear()
+            _FIRST_NODE_CACHE[expr] = host
             return host
 
     # Conservative fallback for unresolved compressed expressions.
@@ -378,14 +666,64 @@ def run_job_action(action: str, job_id: str) -> ActionResult:
     return ActionResult(job_id=job_id, action=action, ok=ok, message=err or ("ok" if ok else "failed"))
 
 
+# Upper bound on concurrent scancel/scontrol processes for bulk actions; keeps
+# slurmctld (and sshd's MaxStartups when remote) from being flooded.
+_BULK_ACTION_WORKERS = 8
+
+
+_JOB_ID_RE = re.compile(r"\d+(?:_\d+)?")
+
+
+def _bulk_action_cmd(action: str, job_ids: list[str]) -> str | None:
+    """Return a single command applying action to all job_ids, if Slurm supports one."""
+    if action == "cancel":
+        return "scancel " + " ".join(shlex.quote(job_id) for job_id in job_ids)
+    if action in ("hold", "release", "requeue"):
+        return f"scontrol {action} {shlex.quote(','.join(job_ids))}"
+    return None
+
+
 def run_bulk_job_action(action: str, job_ids: list[str]) -> list[ActionResult]:
-    return [run_job_action(action, job_id) for job_id in job_ids]
+    """Apply action to every job; results follow job_ids order.
+
+    Tries one scancel/scontrol call for the whole selection and attributes stderr
+    lines back to the job ids they mention. Falls back to concurrent per-job calls
+    only when the batch command could not be launched; any other unattributed
+    failure marks every job failed, since the batch may already have acted on
+    some of them.
+    """
+    action = action.lower()
+    cmd = _bulk_action_cmd(action, job_ids) if len(job_ids) > 1 else None
+    batch = _run_command(cmd) if cmd is not None else None
+    if batch is not None:
+        _, ok, stderr = batch
+        for job_id in job_ids:
+            invalidate_job_detail(job_id)
+        if ok:
+            return [ActionResult(job_id=job_id, action=action, ok=True, message="ok") for job_id in job_ids]
+        wanted = set(job_ids)
+        failures: dict[str, str] = {}
+        for line in stderr.splitlines():
+            for job_id in _JOB_ID_RE.findall(line):
+                if job_id in wanted:
+                    failures.setdefault(job_id, line.strip())
+        if failures:
+            return [
+                ActionResult(job_id=job_id, action=action, ok=job_id not in failures, message=failures.get(job_id, "ok"))
+                for job_id in job_ids
+            ]
+        message = stderr or "failed"
+        return [ActionResult(job_id=job_id, action=action, ok=False, message=message) for job_id in job_ids]
+    if len(job_ids) <= 1:
+        return [run_job_action(action, job_id) for job_id in job_ids]
+    with ThreadPoolExecutor(max_workers=min(_BULK_ACTION_WORKERS, len(job_ids))) as pool:
+        return list(pool.map(lambda job_id: run_job_action(action, job_id), job_ids))
 
 
 def fetch_command_health(limit: int = 100) -> list[CommandStat]:
     if limit <= 0:
         return []
-    return list(_COMMAND_HISTORY)[-limit:]
+    return list(islice(_COMMAND_HISTORY, max(0, len(_COMMAND_HISTORY) - limit), None))
 
 
 def _parse_slurm_duration(s: str) -> int:
@@ -502,23 +840,10 @@ def fetch_array_tasks(job_id: str) -> list[Job]:
     out = _run(f"squeue --noheader -j {shlex.quote(job_id)} -o '{fmt}'")
     jobs = []
     for line in out.strip().splitlines():
-        parts = line.split("|")
+        parts = line.split("|", 10)
         if len(parts) < 11:
             continue
-        jobs.append(Job(
-            job_id=parts[0],
-            name=parts[1],
-            user=parts[2],
-            state=parts[3],
-            partition=parts[4],
-            nodes=parts[5],
-            num_cpus=parts[6],
-            time_used=parts[7],
-            time_limit=parts[8],
-            reason=parts[9],
-            nodelist=parts[10],
-            num_nodes=parts[5],
-        ))
+        jobs.append(Job(*parts[:6], parts[5], *parts[6:11]))
     return jobs
 
 
@@ -526,7 +851,7 @@ def fetch_array_tasks(job_id: str) -> list[Job]:
 # Job dependencies
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class JobDependency:
     dep_type: str   # "afterok", "afterany", "after", etc.
     job_id: str
@@ -562,7 +887,7 @@ def fetch_job_dependencies(job_id: str) -> list[JobDependency]:
 # Completed jobs (sacct)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class SacctJob:
     job_id: str
     name: str
@@ -588,23 +913,14 @@ def fetch_sacct_jobs(hours: int = 24) -> list[SacctJob]:
         return []
     jobs = []
     for line in out.strip().splitlines():
-        parts = line.split("|")
+        parts = line.split("|", 7)
         if len(parts) < 8:
             continue
         job_id = parts[0]
         # Skip step lines: job IDs containing '.' are steps (e.g. 12345.batch)
         if "." in job_id:
             continue
-        jobs.append(SacctJob(
-            job_id=job_id,
-            name=parts[1],
-            user=parts[2],
-            state=parts[3],
-            num_cpus=parts[4],
-            elapsed=parts[5],
-            exit_code=parts[6],
-            partition=parts[7],
-        ))
+        jobs.append(SacctJob(*parts))  # fields follow the -o column order
     return jobs
 
 
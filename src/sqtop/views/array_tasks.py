@@ -1,6 +1,8 @@
 """Array task expansion modal — shows individual tasks of a job array."""
 from __future__ import annotations
 
+from collections import Counter
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.screen import ModalScreen
@@ -21,6 +23,8 @@ STATE_COLORS = {
     "PREEMPTED": "yellow",
 }
 
+_DONE_STATES = ("COMPLETED", "FAILED", "CANCELLED", "TIMEOUT", "NODE_FAIL", "PREEMPTED")
+
 
 class ArrayTaskScreen(ModalScreen[None]):
     """Modal that lists individual tasks of a job array."""
@@ -92,12 +96,10 @@ class ArrayTaskScreen(ModalScreen[None]):
         table = self.query_one("#array-task-table", CyclicDataTable)
         table.clear()
 
-        running = sum(1 for t in tasks if t.state == "RUNNING")
-        pending = sum(1 for t in tasks if t.state == "PENDING")
-        done = sum(
-            1 for t in tasks
-            if t.state in {"COMPLETED", "FAILED", "CANCELLED", "TIMEOUT", "NODE_FAIL", "PREEMPTED"}
-        )
+        counts = Counter(t.state for t in tasks)
+        running = counts["RUNNING"]
+        pending = counts["PENDING"]
+        done = sum(counts[state] for state in _DONE_STATES)
         self.query_one("#array-task-status", Label).update(
             f"[green]{running} running[/]  "
             f"[yellow]{pending} pending[/]  "
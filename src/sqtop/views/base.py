@@ -1,21 +1,59 @@
 """Base class for live data-table views."""
 from __future__ import annotations
 
+import os
 import threading
+from bisect import bisect_right
+from collections.abc import Callable
+from datetime import datetime
+from functools import lru_cache
 from typing import Generic, TypeVar
 
 from textual import work
-from textual.widgets import Static
+from textual.worker import get_current_worker
+from textual.message import Message
+from textual.widgets import Label, Static
+
+from .widgets import CyclicDataTable
 
 T = TypeVar("T")
 
+# The login user for the "mine" filters; fixed for the life of the process.
+CURRENT_USER = os.getenv("USER", "")
+
+_RESIZE_DEBOUNCE = 0.05  # seconds
+
+
+def visible_columns(
+    columns: list[tuple[str, int, int]],
+) -> Callable[[int], tuple[tuple[str, int], ...]]:
+    """Return a cached fn(width) giving the (name, width) columns shown at that width.
+
+    columns holds (name, width, min_terminal_width) ordered by min_terminal_width,
+    so the columns shown at any width are a prefix of it.
+    """
+    thresholds = [min_w for _, _, min_w in columns]
+
+    @lru_cache(maxsize=32)
+    def visible(width: int) -> tuple[tuple[str, int], ...]:
+        return tuple((name, w) for name, w, _ in columns[: bisect_right(thresholds, width)])
+
+    return visible
+
+
+class RefreshRequested(Message, bubble=False):
+    """Ask a live view to refresh now, in place of its next scheduled tick."""
+
 
 class BaseDataTableView(Static, Generic[T]):
     """Shared refresh loop, sort toggle, and cursor/scroll preservation for data-table views.
 
-    Subclasses must implement _fetch_data(), _get_anchor_key(), and _update_table().
+    Subclasses must implement _fetch_data(), _get_anchor_key(), and _update_table(),
+    and set HEADER_ID to the id of their header Label.
     """
 
+    HEADER_ID: str = ""
+
     def __init__(self, interval: float = 2.0, start_offset: float = 0.0) -> None:
         super().__init__()
         self._interval = interval
@@ -25,6 +63,12 @@ class BaseDataTableView(Static, Generic[T]):
         self._paused: bool = False
         self._sort_col: str | None = None
         self._sort_reversed: bool = False
+        self._last_signature: object | None = None
+        self._table: CyclicDataTable | None = None
+        self._header: Label | None = None
+        # Header markup before and after the "updated" timestamp.
+        self._header_parts: tuple[str, str] = ("[dim]updated ", "[/]")
+        self._resize_timer = None
 
     # ── Subclasses must implement ─────────────────────────────────────────────
 
@@ -40,11 +84,64 @@ class BaseDataTableView(Static, Generic[T]):
         """Update the table with new data. Called on the main thread."""
         raise NotImplementedError
 
+    # ── Optional overrides ────────────────────────────────────────────────────
+
+    def _data_signature(self, data: list[T]) -> object | None:
+        """Return a cheap fingerprint of fetched data, or None to always update.
+
+        Called in the worker thread. When it matches the previous fetch,
+        _data_unchanged() runs instead of _update_table().
+        """
+        return None
+
+    def _data_unchanged(self) -> None:
+        """Called on the main thread when a fetch matched the previous signature.
+
+        By default only the header's "updated" time moves.
+        """
+        self._touch_header_time()
+
+    def _apply_resize(self) -> None:
+        """Re-lay out the table for the current width once resizing settles."""
+
     # ── Provided by base class ────────────────────────────────────────────────
 
+    def _data_table(self) -> CyclicDataTable:
+        # Children are fixed after compose, so look them up once.
+        if self._table is None:
+            self._table = self.query_one(CyclicDataTable)
+        return self._table
+
+    def _header_label(self) -> Label:
+        if self._header is None:
+            self._header = self.query_one(f"#{self.HEADER_ID}", Label)
+        return self._header
+
+    def _touch_header_time(self) -> None:
+        """Restamp the header's "updated" time, reusing the rest of the last header."""
+        before, after = self._header_parts
+        now = datetime.now().strftime("%H:%M:%S")
+        self._header_label().update(f"{before}{now}{after}")
+
+    def on_resize(self, event) -> None:
+        # A window drag fires many resizes; lay the table out once it settles.
+        if self._resize_timer is not None:
+            self._resize_timer.stop()
+        self._resize_timer = self.set_timer(_RESIZE_DEBOUNCE, self._settle_resize)
+
+    def _settle_resize(self) -> None:
+        self._resize_timer = None
+        self._apply_resize()
+
     def _begin_interval(self) -> None:
         """Start the periodic refresh timer."""
-        self._timer = self.set_interval(self._interval, self.refresh_data)
+        self._timer = self.set_interval(self._interval, self._tick)
+
+    def _tick(self) -> None:
+        # While paused or while a fetch is still running (slow slurmctld) the new
+        # worker would return at once; skip starting it at all.
+        if not self._paused and not self._fetch_lock.locked():
+            self.refresh_data()
 
     def start_refresh_loop(self) -> None:
         """Defer first fetch slightly so initial UI and keybindings become responsive."""
@@ -75,6 +172,12 @@ class BaseDataTableView(Static, Generic[T]):
         self._paused = False
         self.refresh_data()
 
+    def on_refresh_requested(self, message: RefreshRequested) -> None:
+        """Fetch now and push the next timer tick a full interval out."""
+        if self._timer is not None:
+            self._timer.reset()
+        self.refresh_data()
+
     @work(thread=True)
     def refresh_data(self) -> None:
         """Fetch data in a background thread; update table on main thread."""
@@ -84,6 +187,15 @@ class BaseDataTableView(Static, Generic[T]):
             return
         try:
             data = self._fetch_data()
+            # Textual cancels a view's workers when it unmounts, but a thread can't be
+            # interrupted mid-fetch; drop the result rather than call back into it.
+            if get_current_worker().is_cancelled:
+                return
+            signature = self._data_signature(data)
+            if signature is not None and signature == self._last_signature:
+                self.app.call_from_thread(self._data_unchanged)
+                return
+            self._last_signature = signature
             self.app.call_from_thread(self._update_table, data)
         finally:
             self._fetch_lock.release()
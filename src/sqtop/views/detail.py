@@ -9,32 +9,44 @@ from rich.console import Console
 from rich.text import Text
 
 
+_JOB_HIGHLIGHT_KEYS = frozenset({
+    "JobId", "JobName", "UserId", "JobState",
+    "NumNodes", "NumCPUs", "TimeLimit", "SubmitTime",
+    "StartTime", "EndTime", "Partition", "NodeList",
+    "Reason", "Priority",
+})
+
+_NODE_HIGHLIGHT_KEYS = frozenset({
+    "NodeName", "State", "CPUTot", "CPUAlloc",
+    "RealMemory", "FreeMem", "OS", "Arch",
+    "CfgTRES", "AllocTRES", "Reason",
+})
+
+
 class DetailView(Static):
     """Renders key=value pairs from scontrol in a formatted panel."""
 
+    _shown: tuple[str, dict[str, str]] | None = None  # (title, data) currently displayed
+
     def show_job(self, data: dict[str, str]) -> None:
-        self._render_kv("Job Detail", data, highlight_keys={
-            "JobId", "JobName", "UserId", "JobState",
-            "NumNodes", "NumCPUs", "TimeLimit", "SubmitTime",
-            "StartTime", "EndTime", "Partition", "NodeList",
-            "Reason", "Priority",
-        })
+        self._render_kv("Job Detail", data, highlight_keys=_JOB_HIGHLIGHT_KEYS)
 
     def show_node(self, data: dict[str, str]) -> None:
-        self._render_kv("Node Detail", data, highlight_keys={
-            "NodeName", "State", "CPUTot", "CPUAlloc",
-            "RealMemory", "FreeMem", "OS", "Arch",
-            "CfgTRES", "AllocTRES", "Reason",
-        })
+        self._render_kv("Node Detail", data, highlight_keys=_NODE_HIGHLIGHT_KEYS)
 
     def _render_kv(
         self,
         title: str,
         data: dict[str, str],
-        highlight_keys: set[str],
+        highlight_keys: frozenset[str],
     ) -> None:
+        if self._shown == (title, data):
+            return
+        hi = highlight_keys
         lines = [f"[bold underline]{title}[/]\n"]
-        for k, v in data.items():
-            key_style = "bold cyan" if k in highlight_keys else "dim"
-            lines.append(f"  [{key_style}]{k}[/]: {v}")
+        lines += [
+            f"  [bold cyan]{k}[/]: {v}" if k in hi else f"  [dim]{k}[/]: {v}"
+            for k, v in data.items()
+        ]
+        self._shown = (title, dict(data))
         self.update("\n".join(lines))
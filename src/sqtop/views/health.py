@@ -1,6 +1,7 @@
 """Health view — command latency and failure diagnostics."""
 from __future__ import annotations
 
+import threading
 from datetime import datetime
 
 from textual.app import ComposeResult
@@ -18,8 +19,10 @@ class HealthView(Static):
         super().__init__()
         self._interval = interval
         self._timer = None
-        self._fetching = False
+        self._fetch_lock = threading.Lock()
         self._last_stats: list[CommandStat] = []
+        self._table: CyclicDataTable | None = None
+        self._header: Label | None = None
 
     def compose(self) -> ComposeResult:
         yield Label("", id="health-header")
@@ -32,45 +35,65 @@ class HealthView(Static):
 
     def on_mount(self) -> None:
         self.refresh_data()
-        self._timer = self.set_interval(self._interval, self.refresh_data)
+        self._timer = self.set_interval(self._interval, self._tick)
 
     def set_interval_rate(self, interval: float) -> None:
         self._interval = interval
         if self._timer:
             self._timer.stop()
-        self._timer = self.set_interval(self._interval, self.refresh_data)
+        self._timer = self.set_interval(self._interval, self._tick)
+
+    def _tick(self) -> None:
+        if not self._fetch_lock.locked():
+            self.refresh_data()
 
     @work(thread=True)
     def refresh_data(self) -> None:
-        if self._fetching:
+        if not self._fetch_lock.acquire(blocking=False):
             return
-        self._fetching = True
         try:
             stats = fetch_command_health(100)
-            self.app.call_from_thread(self._update_table, stats)
+            # One pass, newest first, building ready-to-add cells off the UI thread.
+            failures = 0
+            sum_ms = 0
+            rows: list[tuple[str, str, str, str]] = []
+            for item in reversed(stats):
+                failures += not item.ok
+                sum_ms += item.latency_ms
+                err = item.stderr
+                if len(err) > 40:
+                    err = err[:40] + "..."
+                rows.append((
+                    item.command.split(" ", 1)[0],
+                    "[green]yes[/]" if item.ok else "[red]no[/]",
+                    f"{item.latency_ms} ms",
+                    err,
+                ))
+            avg_ms = sum_ms // len(stats) if stats else 0
+            self.app.call_from_thread(self._update_table, stats, rows, failures, avg_ms)
         finally:
-            self._fetching = False
+            self._fetch_lock.release()
 
-    def _update_table(self, stats: list[CommandStat]) -> None:
+    def _update_table(
+        self,
+        stats: list[CommandStat],
+        rows: list[tuple[str, str, str, str]],
+        failures: int,
+        avg_ms: int,
+    ) -> None:
         self._last_stats = stats
-        table = self.query_one("#health-table", CyclicDataTable)
-        saved_row = table.cursor_row
-        table.clear()
-        for item in reversed(stats[-100:]):
-            err = item.stderr[:40] + ("..." if len(item.stderr) > 40 else "")
-            table.add_row(
-                item.command.split(" ", 1)[0],
-                "[green]yes[/]" if item.ok else "[red]no[/]",
-                f"{item.latency_ms} ms",
-                err,
-            )
-        if stats:
-            table.move_cursor(row=min(saved_row, len(stats) - 1))
-
-        failures = sum(1 for s in stats if not s.ok)
-        avg_ms = int(sum(s.latency_ms for s in stats) / len(stats)) if stats else 0
+        if self._table is None:
+            self._table = self.query_one("#health-table", CyclicDataTable)
+            self._header = self.query_one("#health-header", Label)
+        table = self._table
         now = datetime.now().strftime("%H:%M:%S")
-        self.query_one("#health-header", Label).update(
-            f"[b]health[/b]  [red]{failures} failures[/]  [cyan]{avg_ms}ms avg[/]  "
-            f"[dim]{len(stats)} samples  updated {now}[/]"
-        )
+        with self.app.batch_update():
+            saved_row = table.cursor_row
+            table.clear()
+            table.add_rows(rows)
+            if rows:
+                table.move_cursor(row=min(saved_row, len(rows) - 1))
+            self._header.update(
+                f"[b]health[/b]  [red]{failures} failures[/]  [cyan]{avg_ms}ms avg[/]  "
+                f"[dim]{len(stats)} samples  updated {now}[/]"
+            )
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import os
 from datetime import datetime
 
 from textual.app import ComposeResult
@@ -10,10 +9,9 @@ from textual.binding import Binding
 from textual.screen import ModalScreen
 from textual.widgets import Button, Label, Static
 
-from .base import BaseDataTableView
+from .base import CURRENT_USER, BaseDataTableView
 from .mixins import ModalButtonNavMixin
 from ..slurm import SacctJob, fetch_log_paths, fetch_sacct_jobs
-from .log_viewer import LogViewerScreen, LOG_STDOUT, LOG_STDERR
 from .widgets import CyclicDataTable
 
 STATE_COLORS: dict[str, str] = {
@@ -69,6 +67,7 @@ class HistoryActionScreen(ModalButtonNavMixin, ModalScreen[str | None]):
             yield Button("Close  [dim]esc[/]", id="btn-close", variant="default")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
+        from .log_viewer import LOG_STDOUT, LOG_STDERR
         if event.button.id == "btn-stdout":
             self.dismiss(LOG_STDOUT)
         elif event.button.id == "btn-stderr":
@@ -80,6 +79,8 @@ class HistoryActionScreen(ModalButtonNavMixin, ModalScreen[str | None]):
 class HistoryView(BaseDataTableView[SacctJob]):
     """Displays recently completed/failed jobs via sacct."""
 
+    HEADER_ID = "history-header"
+
     BINDINGS = [
         Binding("enter", "open_job", "Open", show=True),
         Binding("u", "toggle_mine", "My jobs", show=False),
@@ -97,7 +98,7 @@ class HistoryView(BaseDataTableView[SacctJob]):
         yield CyclicDataTable(id="history-table", cursor_type="row", zebra_stripes=True)
 
     def _build_columns(self) -> None:
-        table = self.query_one(CyclicDataTable)
+        table = self._data_table()
         table.clear(columns=True)
         for name, width in COLUMNS:
             table.add_column(name, width=width)
@@ -113,7 +114,7 @@ class HistoryView(BaseDataTableView[SacctJob]):
         return item.job_id
 
     def _job_for_cursor(self) -> SacctJob | None:
-        table = self.query_one(CyclicDataTable)
+        table = self._data_table()
         row = table.cursor_row
         if 0 <= row < len(self._last_jobs):
             return self._last_jobs[row]
@@ -129,6 +130,7 @@ class HistoryView(BaseDataTableView[SacctJob]):
             return
 
         def handle_action(action: str | None) -> None:
+            from .log_viewer import LogViewerScreen, LOG_STDOUT, LOG_STDERR
             if action in (LOG_STDOUT, LOG_STDERR):
                 stdout_path, stderr_path = fetch_log_paths(job.job_id)
                 log_path = stdout_path if action == LOG_STDOUT else stderr_path
@@ -144,15 +146,14 @@ class HistoryView(BaseDataTableView[SacctJob]):
 
         filtered = data
         if self._filter_mine:
-            user = os.getenv("USER", "")
-            filtered = [j for j in filtered if j.user == user]
+            filtered = [j for j in filtered if j.user == CURRENT_USER]
         self._last_jobs = filtered
 
         now = datetime.now().strftime("%H:%M:%S")
         failed = sum(1 for j in filtered if j.state.upper().startswith("FAILED"))
         tags = "[cyan]· mine[/]  " if self._filter_mine else ""
         total_str = f"{len(filtered)}/{len(data)} jobs" if self._filter_mine else f"{len(data)} jobs"
-        self.query_one("#history-header", Label).update(
+        self._header_label().update(
             f"[b]sacct[/b]  [dim]last {self._hours}h[/]  "
             f"{tags}"
             f"[red]{failed} failed[/]  "
@@ -164,7 +165,7 @@ class HistoryView(BaseDataTableView[SacctJob]):
         self._restore_table_state(state, filtered)
 
     def _capture_table_state(self) -> tuple[int, float, str | None]:
-        table = self.query_one(CyclicDataTable)
+        table = self._data_table()
         row = table.cursor_row
         scroll_y = float(table.scroll_offset.y)
         anchor: str | None = None
@@ -178,7 +179,7 @@ class HistoryView(BaseDataTableView[SacctJob]):
         if not rows:
             return
         saved_row, scroll_y, anchor = state
-        table = self.query_one(CyclicDataTable)
+        table = self._data_table()
         row = None
         if anchor:
             for i, job in enumerate(rows):
@@ -201,19 +202,20 @@ class HistoryView(BaseDataTableView[SacctJob]):
         return "green" if exit_code == "0:0" else "red"
 
     def _render_rows(self, jobs: list[SacctJob]) -> None:
-        table = self.query_one(CyclicDataTable)
-        table.clear()
-        for job in jobs:
-            state_color = self._state_color(job.state)
-            exit_color = self._exit_color(job.exit_code)
-            table.add_row(
+        rows = [
+            (
                 job.job_id,
                 job.name,
                 job.user,
-                f"[{state_color}]{job.state}[/]",
+                f"[{self._state_color(job.state)}]{job.state}[/]",
                 job.elapsed,
-                f"[{exit_color}]{job.exit_code}[/]",
+                f"[{self._exit_color(job.exit_code)}]{job.exit_code}[/]",
                 job.partition,
             )
+            for job in jobs
+        ]
+        table = self._data_table()
+        table.clear()
+        table.add_rows(rows)
         if jobs and table.cursor_row < 0:
             table.move_cursor(row=0)
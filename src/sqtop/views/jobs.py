@@ -6,12 +6,15 @@ import os
 import shlex
 import subprocess
 import sys
-from datetime import datetime
+from collections.abc import Callable
+from operator import attrgetter
 
 from textual import work
 from textual.app import ComposeResult
 from textual.binding import Binding
+from textual.coordinate import Coordinate
 from textual.widgets import DataTable, Input, Label
+from textual.widgets.data_table import ColumnKey
 
 from ..slurm import (
     ActionResult,
@@ -26,16 +29,10 @@ from ..slurm import (
     run_attach_command,
 )
 from .. import config
-from .base import BaseDataTableView
-from .attach_prompt import AttachNodePromptScreen
+from .base import CURRENT_USER, BaseDataTableView, visible_columns
 from .bulk_actions import BulkActionScreen
 from .confirm import ConfirmScreen
-from .job_actions import JobActionScreen
 from .job_detail import JobDetailScreen
-from .job_info import JobInfoScreen
-from .array_tasks import ArrayTaskScreen
-from .batch_script import BatchScriptScreen
-from .log_viewer import LogViewerScreen, LOG_STDOUT, LOG_STDERR
 from .widgets import CyclicDataTable
 
 _STATE_ORDER = {"COMPLETING": 0, "RUNNING": 1, "PENDING": 2}
@@ -122,10 +119,27 @@ def _time_left(job: Job) -> tuple[str, str]:
     return (display, color)
 
 
+def _job_fields(job: Job) -> tuple:
+    """Every Job field a rendered row can depend on (job_id is the cache key)."""
+    return (
+        job.name, job.user, job.state, job.partition, job.nodes, job.num_cpus,
+        job.time_used, job.time_limit, job.reason, job.nodelist, job.qos,
+    )
+
+
+def _count_running_pending(jobs: list[Job]) -> tuple[int, int]:
+    running = pending = 0
+    for job in jobs:
+        state = job.state
+        if state == "RUNNING":
+            running += 1
+        elif state == "PENDING":
+            pending += 1
+    return running, pending
+
+
 def _job_sort_key(job: Job) -> tuple:
-    priority = _STATE_ORDER.get(job.state, 3)
-    job_id = int(job.job_id) if job.job_id.isdigit() else 0
-    return (priority, job_id)
+    return (_STATE_ORDER.get(job.state, 3), job.numeric_id)
 
 
 def _copy_to_clipboard(text: str) -> bool:
@@ -162,9 +176,13 @@ STATE_COLORS = {
     "PREEMPTED": "yellow",
 }
 
+# Opening markup tag per state, so colored cells skip formatting the color name.
+_STATE_TAGS = {state: f"[{color}]" for state, color in STATE_COLORS.items()}
+_DEFAULT_STATE_TAG = "[white]"
+
 # sort key functions keyed by column name
 _SORT_KEYS = {
-    "state":  lambda j: (j.state, int(j.job_id) if j.job_id.isdigit() else 0),
+    "state":  lambda j: (j.state, j.numeric_id),
     "time":   lambda j: j.time_used,
     "cpus":   lambda j: int(j.num_cpus) if j.num_cpus.isdigit() else 0,
     "qos":    lambda j: (j.qos.lower(), _job_sort_key(j)),
@@ -203,8 +221,35 @@ _CONFIG_COL_KEYS = {
 }
 
 
-def _visible_cols(width: int) -> list[tuple[str, int]]:
-    return [(name, min_w) for name, min_w, min_term_w in COLUMNS if min_term_w <= width]
+# Unstyled, untruncated cell text per column; anything else is NODELIST(REASON).
+# attrgetter runs in C, which matters since these are called rows x cols times.
+_PLAIN_CELLS: dict[str, Callable[[Job], str]] = {
+    "JOBID":      attrgetter("job_id"),
+    "NAME":       attrgetter("name"),
+    "STATE":      attrgetter("state"),
+    "USER":       attrgetter("user"),
+    "TIME":       attrgetter("time_used"),
+    "TIME_LEFT":  lambda j: _time_left(j)[0],
+    "PARTITION":  attrgetter("partition"),
+    "QOS":        lambda j: j.qos or "",
+    "NODES":      attrgetter("nodes"),
+    "CPUS":       attrgetter("num_cpus"),
+    "TIME_LIMIT": attrgetter("time_limit"),
+}
+
+
+def _nodelist_or_reason(job: Job) -> str:
+    return job.nodelist or job.reason
+
+
+_SEARCH_DEBOUNCE = 0.15  # seconds
+
+# Each DataTable.remove_row reindexes every row, so past this many removals
+# clearing and refilling the table is cheaper than patching it.
+_MAX_ROW_REMOVALS = 16
+
+
+_visible_cols = visible_columns(COLUMNS)
 
 
 def _truncate(text: str, max_len: int | None) -> str:
@@ -234,6 +279,8 @@ def _coerce_bool(value: object, default: bool) -> bool:
 class JobsView(BaseDataTableView[Job]):
     """Displays a live squeue-style table."""
 
+    HEADER_ID = "jobs-header"
+
     BINDINGS = [
         Binding("enter", "open_job", "Open", show=True),
         Binding("u", "toggle_mine", "My jobs", show=True),
@@ -264,13 +311,24 @@ class JobsView(BaseDataTableView[Job]):
         self._last_jobs_raw: list[Job] = []
         self._last_jobs: list[Job] = []
         self._last_jobs_index: dict[str, int] = {}
+        # (jobs list, running, pending) as counted by the worker that fetched it.
+        self._state_counts: tuple[list[Job], int, int] = ([], 0, 0)
         self._current_cols: list[tuple[str, int]] = []
+        self._search_timer = None
+        self._header_signature: tuple | None = None  # inputs _header_parts was built from
+        self._col_fns: list[Callable[[Job, str, str], str]] = []
+        self._col_keys: list[ColumnKey] = []  # parallel to _current_cols
         self._rebuild_cache_width: int = -1
         self._rebuild_cache_names: list[str] = []
         self._rebuild_cache_had_jobs: bool = False
         self._filter_mine: bool = False
         self._filter_state: str = ""
         self._search_query: str = ""
+        self._search_bar: Input | None = None
+        # Lowercased searchable text per job of _search_source, rebuilt once per fetch
+        # rather than on every keystroke.
+        self._search_source: list[Job] | None = None
+        self._search_text: list[str] = []
         self._watched_states: dict[str, str] = {}  # job_id → last known state
         cfg_all = config.load()
         cfg = cfg_all.get("jobs", {})
@@ -303,6 +361,9 @@ class JobsView(BaseDataTableView[Job]):
         )
         self._last_render_fp: tuple = ()
         self._fp_skip_count: int = 0
+        # job_id → (fingerprint, rendered cells) for the rows currently in the table,
+        # in table order; reset whenever the columns (and so the table) are cleared.
+        self._row_cache: dict[str, tuple[tuple | None, tuple[str, ...]]] = {}
 
     def compose(self) -> ComposeResult:
         yield Label("", id="jobs-header")
@@ -313,57 +374,66 @@ class JobsView(BaseDataTableView[Job]):
         )
 
     def on_mount(self) -> None:
-        self.query_one("#search-bar", Input).display = False
+        self._search_input().display = False
         self._rebuild_columns(self.size.width, [], force=True)
         self.start_refresh_loop()
 
     def _fetch_data(self) -> list[Job]:
-        return fetch_jobs()
+        # Runs on the worker thread: presort into the default order and count
+        # states here so the UI thread only filters and renders.
+        jobs = fetch_jobs()
+        jobs.sort(key=_job_sort_key)
+        self._state_counts = (jobs, *_count_running_pending(jobs))
+        return jobs
+
+    def _search_input(self) -> Input:
+        # Escape checks the bar on every press, so keep it instead of querying each time.
+        if self._search_bar is None:
+            self._search_bar = self.query_one("#search-bar", Input)
+        return self._search_bar
 
     def _get_anchor_key(self, item: Job) -> str:
         return item.job_id
 
-    def on_resize(self, event) -> None:
+    def _data_signature(self, data: list[Job]) -> object | None:
+        return hash(tuple((j.job_id, _job_fields(j)) for j in data))
+
+    def _apply_resize(self) -> None:
         state = self._capture_table_state()
-        self._rebuild_columns(event.size.width, self._last_jobs, force=True)
+        self._rebuild_columns(self.size.width, self._last_jobs, force=True)
         self._render_rows(self._last_jobs)
         self._restore_table_state(state, self._last_jobs)
 
     def _plain_cell(self, job: Job, col_name: str) -> str:
+        return _PLAIN_CELLS.get(col_name, _nodelist_or_reason)(job)
+
+    def _cell_renderer(self, col_name: str) -> Callable[[Job, str, str], str]:
+        """Return fn(job, state_tag, jobid_prefix) producing the styled cell for col_name."""
+        plain = _PLAIN_CELLS.get(col_name, _nodelist_or_reason)
+        max_len = self._col_max.get(col_name)
+        if max_len is None:
+            # Most columns have no length cap, so use the getter as is.
+            text = plain
+        else:
+            def text(job: Job) -> str:
+                value = plain(job)
+                return value if len(value) <= max_len else _truncate(value, max_len)
         if col_name == "JOBID":
-            return job.job_id
-        if col_name == "NAME":
-            return job.name
-        if col_name == "STATE":
-            return job.state
-        if col_name == "USER":
-            return job.user
-        if col_name == "TIME":
-            return job.time_used
+            return lambda job, tag, prefix: f"{tag}{prefix}{text(job)}[/]"
+        if col_name in ("NAME", "STATE"):
+            return lambda job, tag, prefix: f"{tag}{text(job)}[/]"
         if col_name == "TIME_LEFT":
-            display, _ = _time_left(job)
-            return display
-        if col_name == "PARTITION":
-            return job.partition
-        if col_name == "QOS":
-            return job.qos or ""
-        if col_name == "NODES":
-            return job.nodes
-        if col_name == "CPUS":
-            return job.num_cpus
-        if col_name == "TIME_LIMIT":
-            return job.time_limit
-        return job.nodelist or job.reason
-
-    def _cell_text(self, job: Job, col_name: str) -> str:
-        return _truncate(self._plain_cell(job, col_name), self._col_max.get(col_name))
+            def time_left(job: Job, tag: str, prefix: str) -> str:
+                display, tl_color = _time_left(job)
+                return f"[{tl_color}]{display}[/]"
+            return time_left
+        return lambda job, tag, prefix: text(job)
 
     def _visible_cols_filtered(self, width: int) -> list[tuple[str, int]]:
-        return [
-            (name, min_w)
-            for name, min_w, min_term_w in COLUMNS
-            if min_term_w <= width and name not in self._hidden_cols
-        ]
+        visible = _visible_cols(width)
+        if not self._hidden_cols:
+            return list(visible)
+        return [col for col in visible if col[0] not in self._hidden_cols]
 
     def _rebuild_columns(self, width: int, jobs: list[Job], *, force: bool = False) -> None:
         visible = self._visible_cols_filtered(width)
@@ -380,13 +450,14 @@ class JobsView(BaseDataTableView[Job]):
                 return
         new_cols: list[tuple[str, int]] = []
         for col_name, min_w in visible:
-            if jobs:
-                longest = max(
-                    len(col_name),
-                    *(len(self._cell_text(job, col_name)) for job in jobs),
-                )
-            else:
-                longest = len(col_name)
+            # One pass per column over the raw text lengths; truncating to
+            # max_len only ever shortens a cell to max_len, so cap the length
+            # instead of building the truncated strings.
+            longest = max(map(len, map(_PLAIN_CELLS.get(col_name, _nodelist_or_reason), jobs)), default=0)
+            max_len = self._col_max.get(col_name)
+            if max_len is not None and 0 < max_len < longest:
+                longest = max_len
+            longest = max(len(col_name), longest)
             max_w = self._col_max.get(col_name, max(min_w, longest + 1))
             col_width = max(min_w, min(longest + 1, max_w))
             new_cols.append((col_name, col_width))
@@ -396,14 +467,37 @@ class JobsView(BaseDataTableView[Job]):
         self._rebuild_cache_had_jobs = has_jobs
         if new_cols == self._current_cols:
             return
+        old_cols = self._current_cols
         self._current_cols = new_cols
-        table = self.query_one(CyclicDataTable)
+        self._col_fns = [self._cell_renderer(name) for name, _ in new_cols]
+        table = self._data_table()
+        shared = 0
+        for old, new in zip(old_cols, new_cols):
+            if old != new:
+                break
+            shared += 1
+        if shared and shared == min(len(old_cols), len(new_cols)):
+            # Only trailing columns came or went (a width breakpoint was crossed):
+            # patch those instead of tearing the whole table down.
+            for key in self._col_keys[shared:]:
+                table.remove_column(key)
+            del self._col_keys[shared:]
+            for name, col_width in new_cols[shared:]:
+                self._col_keys.append(table.add_column(name, width=col_width))
+            # Keep the cache mirroring the table: drop removed cells, and blank added
+            # ones with a forced miss so the next render fills them in.
+            pad = ("",) * (len(new_cols) - shared)
+            self._row_cache = {
+                job_id: (None if pad else fp, row[:shared] + pad)
+                for job_id, (fp, row) in self._row_cache.items()
+            }
+            return
+        self._row_cache = {}
         table.clear(columns=True)
-        for name, col_width in self._current_cols:
-            table.add_column(name, width=col_width)
+        self._col_keys = [table.add_column(name, width=col_width) for name, col_width in new_cols]
 
     def _capture_table_state(self) -> tuple[int, float, str | None]:
-        table = self.query_one(CyclicDataTable)
+        table = self._data_table()
         row = table.cursor_row
         scroll_y = float(table.scroll_offset.y)
         anchor: str | None = None
@@ -415,7 +509,7 @@ class JobsView(BaseDataTableView[Job]):
         if not jobs:
             return
         saved_row, scroll_y, anchor = state
-        table = self.query_one(CyclicDataTable)
+        table = self._data_table()
         row = self._last_jobs_index.get(anchor) if anchor else None
         if row is None:
             row = min(saved_row, len(jobs) - 1)
@@ -436,7 +530,7 @@ class JobsView(BaseDataTableView[Job]):
         self.notify(f"Filter: {self._filter_state or 'ALL'}", title="State Filter")
 
     def action_activate_search(self) -> None:
-        bar = self.query_one("#search-bar", Input)
+        bar = self._search_input()
         bar.display = True
         bar.focus()
 
@@ -455,26 +549,28 @@ class JobsView(BaseDataTableView[Job]):
         self._set_sort("cpus")
 
     def action_yank_job_id(self) -> None:
-        table = self.query_one(CyclicDataTable)
+        table = self._data_table()
         row_idx = table.cursor_row
         if row_idx >= len(self._last_jobs):
             return
         job = self._last_jobs[row_idx]
-        if _copy_to_clipboard(job.job_id):
-            self.app.notify(f"Copied: {job.job_id}", title="Clipboard")
-        else:
-            self.app.notify("Clipboard unavailable", severity="warning")
+        self._copy(job.job_id, f"Copied: {job.job_id}")
 
     def action_yank_row(self) -> None:
-        row_idx = self.query_one(CyclicDataTable).cursor_row
+        row_idx = self._data_table().cursor_row
         if row_idx >= len(self._last_jobs):
             return
         job = self._last_jobs[row_idx]
         tsv = "\t".join(self._plain_cell(job, name) for name, _ in self._current_cols)
-        if _copy_to_clipboard(tsv):
-            self.app.notify(f"Copied row for job {job.job_id}", title="Clipboard")
+        self._copy(tsv, f"Copied row for job {job.job_id}")
+
+    @work(thread=True)
+    def _copy(self, text: str, message: str) -> None:
+        # The clipboard helper can take up to its 2s timeout; keep the UI live meanwhile.
+        if _copy_to_clipboard(text):
+            self.app.call_from_thread(self.app.notify, message, title="Clipboard")
         else:
-            self.app.notify("Clipboard unavailable", severity="warning")
+            self.app.call_from_thread(self.app.notify, "Clipboard unavailable", severity="warning")
 
     def action_view_dependencies(self) -> None:
         if job := self._job_for_cursor():
@@ -483,35 +579,43 @@ class JobsView(BaseDataTableView[Job]):
 
     def action_job_info(self) -> None:
         if job := self._job_for_cursor():
+            from .job_info import JobInfoScreen
             self.app.push_screen(JobInfoScreen(job))
 
     def action_expand_array(self) -> None:
         if job := self._job_for_cursor():
+            from .array_tasks import ArrayTaskScreen
             self.app.push_screen(ArrayTaskScreen(job))
 
-    @work(thread=True)
     def action_view_log(self) -> None:
-        job = self._job_for_cursor()
-        if not job:
-            return
-        stdout_path, _ = fetch_log_paths(job.job_id)
-        if not stdout_path:
+        from .log_viewer import LOG_STDOUT
+        if job := self._job_for_cursor():
+            self._open_log(job, LOG_STDOUT)
+
+    @work(thread=True)
+    def _open_log(self, job: Job, stream: str) -> None:
+        from .log_viewer import LogViewerScreen, LOG_STDOUT
+        stdout_path, stderr_path = fetch_log_paths(job.job_id)
+        log_path = stdout_path if stream == LOG_STDOUT else stderr_path
+        if not log_path:
             self.app.call_from_thread(
                 self.app.notify, "No log path found", severity="warning"
             )
             return
+        # Screens are widgets, so build them on the UI thread along with the push.
         self.app.call_from_thread(
-            self.app.push_screen, LogViewerScreen(job.job_id, stdout_path, LOG_STDOUT)
+            lambda: self.app.push_screen(LogViewerScreen(job.job_id, log_path, stream))
         )
 
-    @work(thread=True)
     def action_show_detail(self) -> None:
-        job = self._job_for_cursor()
-        if not job:
-            return
+        if job := self._job_for_cursor():
+            self._show_detail(job)
+
+    @work(thread=True)
+    def _show_detail(self, job: Job) -> None:
         data = fetch_job_detail(job.job_id)
         self.app.call_from_thread(
-            self.app.push_screen, JobDetailScreen(job.job_id, data)
+            lambda: self.app.push_screen(JobDetailScreen(job.job_id, data))
         )
 
     def _reload_column_visibility(self) -> None:
@@ -521,7 +625,7 @@ class JobsView(BaseDataTableView[Job]):
         self._render_rows(self._last_jobs)
 
     def action_watch_job(self) -> None:
-        table = self.query_one(CyclicDataTable)
+        table = self._data_table()
         row_idx = table.cursor_row
         if row_idx >= len(self._last_jobs):
             return
@@ -544,7 +648,7 @@ class JobsView(BaseDataTableView[Job]):
         return bool(getattr(self.app, "confirm_bulk_actions", self._confirm_bulk_actions))
 
     def _job_for_cursor(self) -> Job | None:
-        table = self.query_one(CyclicDataTable)
+        table = self._data_table()
         row_idx = table.cursor_row
         if row_idx >= len(self._last_jobs):
             return None
@@ -598,9 +702,7 @@ class JobsView(BaseDataTableView[Job]):
             return
 
         def execute() -> None:
-            results = run_bulk_job_action(action, job_ids)
-            self._run_action_results(action, results)
-            self.refresh_data()
+            self._execute_bulk_action(action, job_ids)
 
         expert_mode = self._expert_mode_enabled()
         need_confirm = (
@@ -615,6 +717,12 @@ class JobsView(BaseDataTableView[Job]):
         else:
             execute()
 
+    @work(thread=True)
+    def _execute_bulk_action(self, action: str, job_ids: list[str]) -> None:
+        results = run_bulk_job_action(action, job_ids)
+        self.app.call_from_thread(self._run_action_results, action, results)
+        self.app.call_from_thread(self.refresh_data)
+
     def action_bulk_actions(self) -> None:
         selected_ids = self._selected_or_current_job_ids()
         if not selected_ids:
@@ -640,9 +748,16 @@ class JobsView(BaseDataTableView[Job]):
     # ── Input / key events ────────────────────────────────────────────────────
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        if event.input.id == "search-bar":
+        if event.input.id == "search-bar" and event.value != self._search_query:
             self._search_query = event.value
-            self._update_table(self._last_jobs_raw)
+            # Refilter once typing pauses rather than on every keystroke.
+            if self._search_timer is not None:
+                self._search_timer.stop()
+            self._search_timer = self.set_timer(_SEARCH_DEBOUNCE, self._apply_search)
+
+    def _apply_search(self) -> None:
+        self._search_timer = None
+        self._update_table(self._last_jobs_raw)
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         if event.input.id == "search-bar":
@@ -650,18 +765,21 @@ class JobsView(BaseDataTableView[Job]):
 
     def on_key(self, event) -> None:
         if event.key == "escape":
-            bar = self.query_one("#search-bar", Input)
+            bar = self._search_input()
             if bar.display:
                 self._dismiss_search()
                 event.stop()
 
     def _dismiss_search(self) -> None:
-        bar = self.query_one("#search-bar", Input)
+        bar = self._search_input()
         bar.display = False
         bar.value = ""
         self._search_query = ""
+        if self._search_timer is not None:
+            self._search_timer.stop()
+            self._search_timer = None
         self._update_table(self._last_jobs_raw)
-        self.query_one(CyclicDataTable).focus()
+        self._data_table().focus()
 
     def _resolve_attach_command(self) -> str:
         command = self._attach_default_command.strip() or "$SHELL -l"
@@ -738,62 +856,83 @@ class JobsView(BaseDataTableView[Job]):
     # ── Data pipeline ────────────────────────────────────────────────────────
 
     def _update_table(self, jobs: list[Job]) -> None:
-        state = self._capture_table_state()
-        self._last_jobs_raw = jobs
-        valid_ids = {j.job_id for j in jobs}
-        self._selected_job_ids.intersection_update(valid_ids)
-        self._check_watched_jobs(jobs)
+        # One repaint for the table and header together.
+        with self.app.batch_update():
+            state = self._capture_table_state()
+            self._last_jobs_raw = jobs
+            valid_ids = {j.job_id for j in jobs}
+            self._selected_job_ids.intersection_update(valid_ids)
+            self._check_watched_jobs(jobs)
+
+            filtered = jobs
+            if self._search_query:
+                # Search first: its lowercased text is indexed against the raw list.
+                q = self._search_query.lower()
+                filtered = [j for j, text in zip(jobs, self._search_index(jobs)) if q in text]
+            if self._filter_mine:
+                filtered = [j for j in filtered if j.user == CURRENT_USER]
+            if self._filter_state:
+                _FILTER_TERMINAL_STATES = {"FAILED", "CANCELLED", "TIMEOUT", "NODE_FAIL", "PREEMPTED", "OUT_OF_MEMORY"}
+                if self._filter_state == "FAILED":
+                    filtered = [j for j in filtered if j.state in _FILTER_TERMINAL_STATES]
+                else:
+                    filtered = [j for j in filtered if j.state == self._filter_state]
 
-        filtered = jobs
-        if self._filter_mine:
-            user = os.getenv("USER", "")
-            filtered = [j for j in filtered if j.user == user]
-        if self._filter_state:
-            _FILTER_TERMINAL_STATES = {"FAILED", "CANCELLED", "TIMEOUT", "NODE_FAIL", "PREEMPTED", "OUT_OF_MEMORY"}
-            if self._filter_state == "FAILED":
-                filtered = [j for j in filtered if j.state in _FILTER_TERMINAL_STATES]
+            if self._sort_col is None:
+                # _fetch_data already sorted the raw list, and filtering keeps that order.
+                self._last_jobs = list(filtered)
             else:
-                filtered = [j for j in filtered if j.state == self._filter_state]
-        if self._search_query:
-            q = self._search_query.lower()
-            filtered = [
-                j for j in filtered
-                if q in j.name.lower() or q in j.state.lower() or q in j.partition.lower() or q in j.job_id
+                key_fn = _SORT_KEYS[self._sort_col]
+                self._last_jobs = sorted(filtered, key=key_fn, reverse=self._sort_reversed)
+            self._last_jobs_index = {j.job_id: i for i, j in enumerate(self._last_jobs)}
+
+            new_fp = (
+                tuple((j.job_id, j.state) for j in self._last_jobs),
+                frozenset(self._watched_states),
+                frozenset(self._selected_job_ids),
+            )
+            if new_fp == self._last_render_fp:
+                self._fp_skip_count += 1
+                if self._fp_skip_count < 5:
+                    self._update_header(jobs)
+                    return
+                self._fp_skip_count = 0
+            else:
+                self._fp_skip_count = 0
+                self._last_render_fp = new_fp
+
+            self._rebuild_columns(self.size.width, self._last_jobs)
+            self._render_rows(self._last_jobs)
+            self._restore_table_state(state, self._last_jobs)
+            self._update_header(jobs)
+
+    def _search_index(self, jobs: list[Job]) -> list[str]:
+        """Return the lowercased name/state/partition/id text for each job."""
+        if jobs is not self._search_source:
+            self._search_source = jobs
+            # NUL separators keep a query from matching across two fields.
+            self._search_text = [
+                f"{j.name}\0{j.state}\0{j.partition}\0{j.job_id}".lower() for j in jobs
             ]
-
-        if self._sort_col is None:
-            self._last_jobs = sorted(filtered, key=_job_sort_key)
-        else:
-            key_fn = _SORT_KEYS[self._sort_col]
-            self._last_jobs = sorted(filtered, key=key_fn, reverse=self._sort_reversed)
-        self._last_jobs_index = {j.job_id: i for i, j in enumerate(self._last_jobs)}
-
-        new_fp = (
-            tuple((j.job_id, j.state) for j in self._last_jobs),
-            frozenset(self._watched_states),
-            frozenset(self._selected_job_ids),
-        )
-        if new_fp == self._last_render_fp:
-            self._fp_skip_count += 1
-            if self._fp_skip_count < 5:
-                self._update_header(jobs)
-                return
-            self._fp_skip_count = 0
-        else:
-            self._fp_skip_count = 0
-            self._last_render_fp = new_fp
-
-        self._rebuild_columns(self.size.width, self._last_jobs)
-        self._render_rows(self._last_jobs)
-        self._restore_table_state(state, self._last_jobs)
-        self._update_header(jobs)
+        return self._search_text
 
     def _update_header(self, all_jobs: list[Job]) -> None:
-        now = datetime.now().strftime("%H:%M:%S")
-        running = sum(1 for j in all_jobs if j.state == "RUNNING")
-        pending = sum(1 for j in all_jobs if j.state == "PENDING")
+        counted, running, pending = self._state_counts
+        if counted is not all_jobs:
+            running, pending = _count_running_pending(all_jobs)
         filtered = len(self._last_jobs)
         total = len(all_jobs)
+        expert = self._expert_mode_enabled()
+        signature = (
+            running, pending, filtered, total, self._filter_mine, self._filter_state,
+            self._search_query, self._sort_col, self._sort_reversed,
+            len(self._watched_states), len(self._selected_job_ids), expert,
+        )
+        if signature == self._header_signature:
+            # Counts and tags are as last time; only the clock moves.
+            self._touch_header_time()
+            return
+        self._header_signature = signature
         count_str = f"{filtered}/{total} jobs" if filtered != total else f"{total} total"
 
         tags: list[str] = []
@@ -810,18 +949,19 @@ class JobsView(BaseDataTableView[Job]):
             tags.append(f"[magenta]· {len(self._watched_states)} watched[/]")
         if self._selected_job_ids:
             tags.append(f"[blue]· {len(self._selected_job_ids)} selected[/]")
-        if self._expert_mode_enabled():
+        if expert:
             tags.append("[red]· expert[/]")
         if all_jobs and (pending / len(all_jobs)) > self._warn_pending_ratio:
             tags.append(f"[red bold]! {pending}/{len(all_jobs)} pending[/]")
 
         suffix = ("  " + "  ".join(tags)) if tags else ""
-        self.query_one("#jobs-header", Label).update(
+        self._header_parts = (
             f"[b]squeue[/b]  [green]{running} running[/]  "
             f"[yellow]{pending} pending[/]  "
-            f"[dim]{count_str}  updated {now}[/]"
-            f"{suffix}"
+            f"[dim]{count_str}  updated ",
+            f"[/]{suffix}",
         )
+        self._touch_header_time()
 
     def _check_watched_jobs(self, jobs: list[Job]) -> None:
         if not self._watched_states:
@@ -849,32 +989,66 @@ class JobsView(BaseDataTableView[Job]):
             del self._watched_states[job_id]
 
     def _render_rows(self, jobs: list[Job]) -> None:
-        table = self.query_one(CyclicDataTable)
+        table = self._data_table()
         saved_row = table.cursor_row
-        table.clear()
+        # Most jobs are unchanged between ticks, so reuse their cells from last time.
+        cache = self._row_cache
+        fresh: dict[str, tuple[tuple | None, tuple[str, ...]]] = {}
         for job in jobs:
-            color = STATE_COLORS.get(job.state, "white")
-            watched_prefix = "★ " if job.job_id in self._watched_states else ""
-            selected_prefix = "✓ " if job.job_id in self._selected_job_ids else ""
-            row = []
-            for name, _ in self._current_cols:
-                if name == "JOBID":
-                    row.append(
-                        f"[{color}]{selected_prefix}{watched_prefix}{self._cell_text(job, name)}[/]"
-                    )
-                elif name == "NAME":
-                    row.append(f"[{color}]{self._cell_text(job, name)}[/]")
-                elif name == "STATE":
-                    row.append(f"[{color}]{self._cell_text(job, name)}[/]")
-                elif name == "TIME_LEFT":
-                    tl_display, tl_color = _time_left(job)
-                    row.append(f"[{tl_color}]{tl_display}[/]")
-                else:
-                    row.append(self._cell_text(job, name))
-            table.add_row(*row)
+            selected = job.job_id in self._selected_job_ids
+            watched = job.job_id in self._watched_states
+            fp = (_job_fields(job), selected, watched)
+            hit = cache.get(job.job_id)
+            if hit is not None and hit[0] == fp:
+                row = hit[1]
+            else:
+                row = self._build_row(job, selected, watched)
+            fresh[job.job_id] = (fp, row)
+
+        order = list(fresh)
+        kept = [job_id for job_id in cache if job_id in fresh]
+        removed = len(cache) - len(kept)
+        if (
+            len(order) != len(jobs)
+            or not kept
+            or removed > _MAX_ROW_REMOVALS
+            or order[: len(kept)] != kept
+        ):
+            # Reordered (or duplicate job ids): rebuild the table from scratch.
+            table.clear()
+            if len(order) == len(jobs):
+                for job_id, (_, row) in fresh.items():
+                    table.add_row(*row, key=job_id)
+            else:
+                # fresh holds one row per id, so render each duplicate on its own.
+                for job in jobs:
+                    table.add_row(*self._build_row(
+                        job, job.job_id in self._selected_job_ids, job.job_id in self._watched_states
+                    ))
+                fresh = {}  # rows are unkeyed, so the next render rebuilds too
+        else:
+            # Same relative order: drop vanished rows, patch changed cells, append new ones.
+            for job_id in cache:
+                if job_id not in fresh:
+                    table.remove_row(job_id)
+            for idx, job_id in enumerate(kept):
+                old_row, new_row = cache[job_id][1], fresh[job_id][1]
+                if new_row is old_row:
+                    continue
+                for col, cell in enumerate(new_row):
+                    if cell != old_row[col]:
+                        table.update_cell_at(Coordinate(idx, col), cell)
+            for job_id in order[len(kept):]:
+                table.add_row(*fresh[job_id][1], key=job_id)
+        self._row_cache = fresh
         if jobs:
             table.move_cursor(row=min(saved_row, len(jobs) - 1))
 
+    def _build_row(self, job: Job, selected: bool, watched: bool) -> tuple[str, ...]:
+        tag = _STATE_TAGS.get(job.state, _DEFAULT_STATE_TAG)
+        prefix = ("✓ " if selected else "") + ("★ " if watched else "")
+        return tuple(fn(job, tag, prefix) for fn in self._col_fns)
+
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         row_idx = event.cursor_row
         if row_idx >= len(self._last_jobs):
@@ -897,24 +1071,16 @@ class JobsView(BaseDataTableView[Job]):
                         return
                     self._run_attach(job, node_value)
 
+                from .attach_prompt import AttachNodePromptScreen
                 self.app.push_screen(AttachNodePromptScreen(default_node), do_attach)
             elif action == "detail":
-                data = fetch_job_detail(job.job_id)
-                self.app.push_screen(JobDetailScreen(job.job_id, data))
+                self._show_detail(job)
             elif action == "batch_script":
+                from .batch_script import BatchScriptScreen
                 self.app.push_screen(BatchScriptScreen(job.job_id))
             elif action == "cancel":
                 def execute_cancel() -> None:
-                    result = run_job_action("cancel", job.job_id)
-                    if result.ok:
-                        self.app.notify(f"Cancelled {job.job_id}", title="Job action")
-                    else:
-                        self.app.notify(
-                            f"Cancel failed: {result.message}",
-                            title="Job action",
-                            severity="warning",
-                        )
-                    self.refresh_data()
+                    self._cancel_job(job)
 
                 need_confirm = (not self._expert_mode_enabled()) and self._confirm_single_cancel_enabled()
                 if need_confirm:
@@ -925,8 +1091,21 @@ class JobsView(BaseDataTableView[Job]):
                 else:
                     execute_cancel()
             else:
-                stdout_path, stderr_path = fetch_log_paths(job.job_id)
-                log_path = stdout_path if action == LOG_STDOUT else stderr_path
-                self.app.push_screen(LogViewerScreen(job.job_id, log_path, action))
+                self._open_log(job, action)
 
+        from .job_actions import JobActionScreen
         self.app.push_screen(JobActionScreen(job), handle_action)
+
+    @work(thread=True)
+    def _cancel_job(self, job: Job) -> None:
+        result = run_job_action("cancel", job.job_id)
+        if result.ok:
+            self.app.call_from_thread(self.app.notify, f"Cancelled {job.job_id}", title="Job action")
+        else:
+            self.app.call_from_thread(
+                self.app.notify,
+                f"Cancel failed: {result.message}",
+                title="Job action",
+                severity="warning",
+            )
+        self.app.call_from_thread(self.refresh_data)
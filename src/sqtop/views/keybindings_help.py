@@ -31,7 +31,7 @@ def _binding_desc(binding: Binding) -> str:
     if binding.description:
         return str(binding.description)
     action = str(binding.action)
-    if action.startswith("switch_tab("):
+    if action.startswith("switch_"):  # switch_jobs, switch_nodes, ...
         return "Switch tab"
     return action.replace("_", " ")
 
@@ -14,6 +14,26 @@ from ..slurm import tail_log_file
 LOG_STDOUT = "stdout"
 LOG_STDERR = "stderr"
 
+# Scrollback kept once new lines start being appended rather than redrawn.
+_MAX_LOG_LINES = 2000
+
+
+def _appended_text(old: str, new: str) -> str | None:
+    """Return what new adds after the lines of old, or None if it is not an append.
+
+    The tail window slides as the log grows, so old's leading lines may have
+    dropped out of new; its remaining lines must start new exactly.
+    """
+    if not old.endswith("\n"):
+        return None  # a partial last line may have grown since
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    for k in range(len(old_lines)):
+        overlap = len(old_lines) - k
+        if new_lines[:overlap] == old_lines[k:]:
+            return "".join(new_lines[overlap:])
+    return None
+
 
 class LogViewerScreen(ModalScreen[None]):
     """Full-screen log viewer with 2s auto-refresh."""
@@ -45,26 +65,39 @@ class LogViewerScreen(ModalScreen[None]):
         self._timer = None
         self._fetch_lock = threading.Lock()
         self._last_content: str = ""
+        self._header: Label | None = None
+        self._log: RichLog | None = None
 
     def compose(self) -> ComposeResult:
         with Static(id="log-dialog"):
             yield Label("", id="log-header")
-            yield RichLog(id="log-output", highlight=True, markup=False, wrap=True)
+            yield RichLog(
+                id="log-output", highlight=True, markup=False, wrap=True, max_lines=_MAX_LOG_LINES
+            )
 
     def on_mount(self) -> None:
+        self._header = self.query_one("#log-header", Label)
+        self._log = self.query_one("#log-output", RichLog)
         self._update_header()
         self.fetch_log()
-        self._timer = self.set_interval(2.0, self.fetch_log)
+        self._timer = self.set_interval(2.0, self._tick)
+
+    def _tick(self) -> None:
+        # A paused viewer would throw the result away, so don't read the log at all.
+        if self._follow:
+            self.fetch_log()
 
     def _update_header(self) -> None:
         follow_status = "[green]following[/]" if self._follow else "[dim]paused[/]"
-        self.query_one("#log-header", Label).update(
+        self._header.update(
             f"[b]{self._log_type}[/b]  {self._log_path}  {follow_status}  [dim]esc=close  f=toggle follow[/]"
         )
 
     def action_toggle_follow(self) -> None:
         self._follow = not self._follow
         self._update_header()
+        if self._follow:
+            self.fetch_log()
 
     @work(thread=True)
     def fetch_log(self) -> None:
@@ -81,7 +114,12 @@ class LogViewerScreen(ModalScreen[None]):
             return
         if content == self._last_content:
             return
+        added = _appended_text(self._last_content, content)
         self._last_content = content
-        log = self.query_one("#log-output", RichLog)
-        log.clear()
-        log.write(content)
+        log = self._log
+        # RichLog turns a trailing newline into a blank line, so drop it before writing.
+        if added is None:
+            log.clear()
+            log.write(content.removesuffix("\n"))
+        elif added:
+            log.write(added.removesuffix("\n"))
@@ -13,20 +13,27 @@ class ModalButtonNavMixin:
         Binding("down", "focus_next", show=False),
     ]
 
+    _nav_buttons: list[Button] | None = None
+    _nav_positions: dict[Button, int] = {}
+
+    def _buttons(self) -> list[Button]:
+        # Modal buttons are fixed once composed, so walk the DOM only on first use.
+        if self._nav_buttons is None:
+            self._nav_buttons = list(self.query(Button))
+            self._nav_positions = {button: i for i, button in enumerate(self._nav_buttons)}
+        return self._nav_buttons
+
     def _focused_button_index(self) -> int:
-        buttons = list(self.query(Button))
-        focused = self.focused
-        try:
-            return buttons.index(focused)
-        except ValueError:
-            return 0
+        # Looked up from the live focus, so mouse or tab focus changes are followed.
+        self._buttons()
+        return self._nav_positions.get(self.focused, 0)
 
     def action_focus_next(self) -> None:
-        buttons = list(self.query(Button))
+        buttons = self._buttons()
         if buttons:
             buttons[(self._focused_button_index() + 1) % len(buttons)].focus()
 
     def action_focus_previous(self) -> None:
-        buttons = list(self.query(Button))
+        buttons = self._buttons()
         if buttons:
             buttons[(self._focused_button_index() - 1) % len(buttons)].focus()
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from collections.abc import Callable
+from functools import lru_cache
+from operator import attrgetter
 
 from textual.app import ComposeResult
 from textual.binding import Binding
+from textual.coordinate import Coordinate
 from textual.widgets import DataTable, Label
 
-from .base import BaseDataTableView
+from .base import BaseDataTableView, visible_columns
 from .widgets import CyclicDataTable
 from .node_detail import NodeDetailScreen
 
@@ -40,33 +43,90 @@ COLUMNS: list[tuple[str, int, int]] = [
 ]
 
 
+@lru_cache(maxsize=256)
+def _pct_bar(pct: int, bar_width: int = 8) -> str:
+    # Only ~101 distinct percentages occur, so each bar string is built once.
+    filled = round(pct / 100 * bar_width)
+    bar = "█" * filled + "░" * (bar_width - filled)
+    color = "green" if pct < 60 else ("yellow" if pct < 90 else "red")
+    return f"[{color}]{bar}[/] {pct:3}%"
+
+
+@lru_cache(maxsize=64)
+def _state_cell(state: str) -> str:
+    """Return the coloured STATE cell; sinfo reports only a few distinct states."""
+    color = STATE_COLORS.get(state.lower().partition("*")[0].rstrip("-"), "white")
+    return f"[{color}]{state}[/]"
+
+
+# Keyed on sinfo's raw strings, so repeat (alloc, total) pairs also skip the int parsing.
+@lru_cache(maxsize=2048)
 def _cpu_bar(alloc: str, total: str, bar_width: int = 8) -> str:
     try:
         a, t = int(alloc), int(total)
-        pct = round(a / t * 100) if t else 0
-        filled = round(pct / 100 * bar_width)
-        bar = "█" * filled + "░" * (bar_width - filled)
-        color = "green" if pct < 60 else ("yellow" if pct < 90 else "red")
-        return f"[{color}]{bar}[/] {pct:3}%"
-    except (ValueError, ZeroDivisionError):
+        return _pct_bar(round(a / t * 100) if t else 0, bar_width)
+    except ValueError:
         return "─" * bar_width
 
 
 def _gpu_bar(alloc: int, total: int, bar_width: int = 8) -> str:
     if total == 0:
         return "[dim]—[/]"
-    try:
-        pct = round(alloc / total * 100)
-        filled = round(pct / 100 * bar_width)
-        bar = "█" * filled + "░" * (bar_width - filled)
-        color = "green" if pct < 60 else ("yellow" if pct < 90 else "red")
-        return f"[{color}]{bar}[/] {pct:3}%"
-    except ZeroDivisionError:
-        return "─" * bar_width
+    return _pct_bar(round(alloc / total * 100), bar_width)
+
+
+def _gpu_count_cell(node: Node) -> str:
+    if node.gpu_total <= 0:
+        return "[dim]—[/]"
+    gpu_color = "green" if node.gpu_total > node.gpu_alloc else "red"
+    return f"[{gpu_color}]{node.gpu_alloc}/{node.gpu_total}[/]"
+
+
+# Styled cell per column, so rendering dispatches with a dict lookup per column.
+# Node's sinfo fields are str, so the plain cells concatenate rather than format.
+_NODE_CELLS: dict[str, Callable[[Node], str]] = {
+    "NODE":      lambda n: f"[bold]{n.name}[/bold]",
+    "STATE":     lambda n: _state_cell(n.state),
+    "CPU%":      lambda n: _cpu_bar(n.cpus_alloc, n.cpus_total),
+    "GPU%":      lambda n: _gpu_bar(n.gpu_alloc, n.gpu_total),
+    "CPUS A/T":  lambda n: n.cpus_alloc + "/" + n.cpus_total,
+    "GPU A/T":   _gpu_count_cell,
+    "MEM FREE":  lambda n: n.memory_free + "M",
+    "PARTITION": attrgetter("partition"),
+    "MEM TOTAL": lambda n: n.memory_total + "M",
+    "LOAD":      attrgetter("load"),
+}
+
+_visible_cols = visible_columns(COLUMNS)
 
 
-def _visible_cols(width: int) -> list[tuple[str, int]]:
-    return [(name, w) for name, w, min_w in COLUMNS if min_w <= width]
+@lru_cache(maxsize=64)
+def _state_flags(state: str) -> tuple[bool, bool, bool, bool]:
+    """Return (idle, alloc, mixed, down/drain) for a sinfo state string.
+
+    A cluster only reports a handful of distinct states, so each is lowered
+    and matched once instead of once per node per tick.
+    """
+    s = state.lower()
+    idle = "idle" in s
+    alloc = not idle and "alloc" in s
+    mixed = not idle and not alloc and "mixed" in s
+    return idle, alloc, mixed, "down" in s or "drain" in s
+
+
+def _count_states(nodes: list[Node]) -> tuple[int, int, int, int, int]:
+    """Return (idle, alloc, mixed, down/drain, total) over the named nodes."""
+    idle = alloc = mixed = down = total = 0
+    for n in nodes:
+        if not n.name:
+            continue
+        is_idle, is_alloc, is_mixed, is_down = _state_flags(n.state)
+        idle += is_idle
+        alloc += is_alloc
+        mixed += is_mixed
+        down += is_down
+        total += 1
+    return idle, alloc, mixed, down, total
 
 
 def _cpu_pct(n: Node) -> float:
@@ -86,6 +146,8 @@ def _free_mem(n: Node) -> int:
 class NodesView(BaseDataTableView[Node]):
     """Displays a live sinfo-style node table."""
 
+    HEADER_ID = "nodes-header"
+
     BINDINGS = [
         Binding("enter", "open_node", "Open node", show=True),
         Binding("s", "sort_state", show=False),
@@ -99,7 +161,15 @@ class NodesView(BaseDataTableView[Node]):
         self._last_nodes_index: dict[str, int] = {}
         self._last_sorted_nodes: list[Node] = []
         self._last_render_fp: tuple = ()
+        # Counts the header's markup (_header_parts) was built from.
+        self._header_signature: tuple | None = None
+        # (nodes list, its header counts) as counted by the worker that fetched it.
+        self._state_counts: tuple[list[Node], tuple[int, ...]] = ([], (0, 0, 0, 0, 0))
         self._current_cols: list[tuple[str, int]] = []
+        # Node names and cells currently in the table, in table order; cleared
+        # whenever the columns (and so the table) are rebuilt.
+        self._row_names: list[str] = []
+        self._row_cells: list[list[str]] = []
         cfg_all = config.load()
         view_state = cfg_all.get("view_state", {})
         saved_sort = str(view_state.get("nodes_sort_col", ""))
@@ -118,30 +188,40 @@ class NodesView(BaseDataTableView[Node]):
         self.start_refresh_loop()
 
     def _fetch_data(self) -> list[Node]:
-        return fetch_nodes()
+        # Runs on the worker thread: count states here so the UI thread only renders.
+        nodes = fetch_nodes()
+        self._state_counts = (nodes, _count_states(nodes))
+        return nodes
 
     def _get_anchor_key(self, item: Node) -> str:
         return item.name
 
-    def on_resize(self, event) -> None:
-        new_cols = self._visible_cols_filtered(event.size.width)
-        if new_cols != self._current_cols:
+    def _data_signature(self, data: list[Node]) -> object | None:
+        return hash(tuple(
+            (n.name, n.state, n.partition, n.cpus_total, n.cpus_alloc, n.memory_total,
+             n.memory_free, n.load, n.gpu_total, n.gpu_alloc)
+            for n in data
+        ))
+
+    def _apply_resize(self) -> None:
+        width = self.size.width
+        if self._visible_cols_filtered(width) != self._current_cols:
             state = self._capture_table_state()
-            self._rebuild_columns(event.size.width)
+            self._rebuild_columns(width)
             self._render_rows(self._last_sorted_nodes)
             self._restore_table_state(state, self._last_sorted_nodes)
 
     def _visible_cols_filtered(self, width: int) -> list[tuple[str, int]]:
-        return [
-            (name, w)
-            for name, w, min_w in COLUMNS
-            if min_w <= width and name not in self._hidden_cols
-        ]
+        visible = _visible_cols(width)
+        if not self._hidden_cols:
+            return list(visible)
+        return [col for col in visible if col[0] not in self._hidden_cols]
 
     def _rebuild_columns(self, width: int) -> None:
         self._current_cols = self._visible_cols_filtered(width)
-        table = self.query_one(CyclicDataTable)
+        table = self._data_table()
         table.clear(columns=True)
+        self._row_names, self._row_cells = [], []
         for name, col_width in self._current_cols:
             table.add_column(name, width=col_width)
 
@@ -152,7 +232,7 @@ class NodesView(BaseDataTableView[Node]):
         self._render_rows(self._last_sorted_nodes)
 
     def _capture_table_state(self) -> tuple[int, float, str | None]:
-        table = self.query_one(CyclicDataTable)
+        table = self._data_table()
         row = table.cursor_row
         scroll_y = float(table.scroll_offset.y)
         anchor: str | None = None
@@ -164,7 +244,7 @@ class NodesView(BaseDataTableView[Node]):
         if not rows:
             return
         saved_row, scroll_y, anchor = state
-        table = self.query_one(CyclicDataTable)
+        table = self._data_table()
         row = self._last_nodes_index.get(anchor) if anchor else None
         if row is None:
             row = min(saved_row, len(rows) - 1)
@@ -175,7 +255,10 @@ class NodesView(BaseDataTableView[Node]):
         super()._set_sort(col)
         config.update({"view_state": {"nodes_sort_col": self._sort_col or "", "nodes_sort_reversed": self._sort_reversed}})
         self._last_sorted_nodes = self._sorted_visible(self._last_nodes)
-        self._render_rows(self._last_sorted_nodes)
+        with self.app.batch_update():
+            self._render_rows(self._last_sorted_nodes)
+            # Unchanged ticks only restamp the header, so show the new sort tag now.
+            self._update_nodes_header(self._last_nodes)
 
     def action_sort_state(self) -> None:
         self._set_sort("state")
@@ -197,31 +280,27 @@ class NodesView(BaseDataTableView[Node]):
         return visible
 
     def _update_nodes_header(self, nodes: list[Node]) -> None:
-        now = datetime.now().strftime("%H:%M:%S")
-        visible = [n for n in nodes if n.name]
-        idle = alloc = mixed = down = 0
-        for n in visible:
-            s = n.state.lower()
-            if "idle" in s:
-                idle += 1
-            elif "alloc" in s:
-                alloc += 1
-            elif "mixed" in s:
-                mixed += 1
-            if "down" in s or "drain" in s:
-                down += 1
-        sort_tag = ""
-        if self._sort_col:
-            arrow = "↑" if self._sort_reversed else "↓"
-            sort_tag = f"  [dim]sort:{self._sort_col}{arrow}[/]"
-        warn_tag = f"  [red bold]! {down} DOWN/DRAIN[/]" if down >= self._warn_down_nodes else ""
-        self.query_one("#nodes-header", Label).update(
-            f"[b]sinfo[/b]  [green]{idle} idle[/]  "
-            f"[cyan]{alloc} alloc[/]  [yellow]{mixed} mixed[/]  "
-            f"[red]{down} down[/]  "
-            f"[dim]{len(visible)} total  updated {now}[/]"
-            f"{sort_tag}{warn_tag}"
-        )
+        counted, counts = self._state_counts
+        if counted is not nodes:
+            counts = _count_states(nodes)
+        idle, alloc, mixed, down, total = counts
+        signature = (*counts, self._sort_col, self._sort_reversed)
+        if signature != self._header_signature:
+            # Rebuild the markup around the timestamp only when a count or tag changed.
+            self._header_signature = signature
+            sort_tag = ""
+            if self._sort_col:
+                arrow = "↑" if self._sort_reversed else "↓"
+                sort_tag = f"  [dim]sort:{self._sort_col}{arrow}[/]"
+            warn_tag = f"  [red bold]! {down} DOWN/DRAIN[/]" if down >= self._warn_down_nodes else ""
+            self._header_parts = (
+                f"[b]sinfo[/b]  [green]{idle} idle[/]  "
+                f"[cyan]{alloc} alloc[/]  [yellow]{mixed} mixed[/]  "
+                f"[red]{down} down[/]  "
+                f"[dim]{total} total  updated ",
+                f"[/]{sort_tag}{warn_tag}",
+            )
+        self._touch_header_time()
 
     def _update_table(self, nodes: list[Node]) -> None:
         state = self._capture_table_state()
@@ -235,45 +314,32 @@ class NodesView(BaseDataTableView[Node]):
             return
         self._last_render_fp = new_fp
 
-        self._render_rows(self._last_sorted_nodes)
-        self._restore_table_state(state, self._last_sorted_nodes)
-        self._update_nodes_header(nodes)
+        with self.app.batch_update():
+            self._render_rows(self._last_sorted_nodes)
+            self._restore_table_state(state, self._last_sorted_nodes)
+            self._update_nodes_header(nodes)
 
     def _render_rows(self, sorted_rows: list[Node] | None = None) -> None:
         rows = sorted_rows if sorted_rows is not None else self._sorted_visible(self._last_nodes)
-        table = self.query_one(CyclicDataTable)
-        table.clear()
-        for node in rows:
-            state_lower = node.state.lower().split("*")[0].rstrip("-")
-            color = STATE_COLORS.get(state_lower, "white")
-            row = []
-            for name, _ in self._current_cols:
-                if name == "NODE":
-                    row.append(f"[bold]{node.name}[/bold]")
-                elif name == "STATE":
-                    row.append(f"[{color}]{node.state}[/]")
-                elif name == "CPU%":
-                    row.append(_cpu_bar(node.cpus_alloc, node.cpus_total))
-                elif name == "GPU%":
-                    row.append(_gpu_bar(node.gpu_alloc, node.gpu_total))
-                elif name == "CPUS A/T":
-                    row.append(f"{node.cpus_alloc}/{node.cpus_total}")
-                elif name == "GPU A/T":
-                    if node.gpu_total > 0:
-                        free = node.gpu_total - node.gpu_alloc
-                        gpu_color = "green" if free > 0 else "red"
-                        row.append(f"[{gpu_color}]{node.gpu_alloc}/{node.gpu_total}[/]")
-                    else:
-                        row.append("[dim]—[/]")
-                elif name == "MEM FREE":
-                    row.append(f"{node.memory_free}M")
-                elif name == "PARTITION":
-                    row.append(node.partition)
-                elif name == "MEM TOTAL":
-                    row.append(f"{node.memory_total}M")
-                elif name == "LOAD":
-                    row.append(node.load)
-            table.add_row(*row)
+        # Resolve each visible column's cell function once, not once per cell.
+        cell_fns = [_NODE_CELLS[name] for name, _ in self._current_cols]
+        out = [[fn(node) for fn in cell_fns] for node in rows]
+        # Format every row first, then touch the table once.
+        table = self._data_table()
+        names = [node.name for node in rows]
+        if names == self._row_names:
+            # Same nodes in the same order (the usual tick): patch only changed cells.
+            for idx, (old_row, row) in enumerate(zip(self._row_cells, out)):
+                if row == old_row:
+                    continue
+                for col, cell in enumerate(row):
+                    if cell != old_row[col]:
+                        table.update_cell_at(Coordinate(idx, col), cell)
+        else:
+            table.clear()
+            table.add_rows(out)
+        self._row_names = names
+        self._row_cells = out
         if rows and table.cursor_row < 0:
             table.move_cursor(row=0)
 
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -30,6 +31,29 @@ STATE_COLORS = {
     "unknown":   "dim",
 }
 
+
+# AVAIL and STATE take only a handful of values, so their coloured cells are
+# built once each rather than for every row (and every column) on each tick.
+@lru_cache(maxsize=64)
+def _avail_cell(avail: str) -> str:
+    return f"[{AVAIL_COLORS.get(avail.lower(), 'white')}]{avail}[/]"
+
+
+@lru_cache(maxsize=64)
+def _state_cell(state: str) -> str:
+    color = STATE_COLORS.get(state.lower().partition("*")[0].rstrip("-"), "white")
+    return f"[{color}]{state}[/]"
+
+
+def _node_count(s: ClusterSummary) -> int:
+    return int(s.nodes) if s.nodes.isdigit() else 0
+
+
+def _render_fp(rows: list[ClusterSummary]) -> tuple:
+    """Fingerprint of the rows as drawn; an equal one means the table is current."""
+    return tuple((s.partition, s.state, s.nodes) for s in rows)
+
+
 COLUMNS: list[tuple[str, int]] = [
     ("PARTITION",  14),
     ("AVAIL",       7),
@@ -43,6 +67,8 @@ COLUMNS: list[tuple[str, int]] = [
 class PartitionsView(BaseDataTableView[ClusterSummary]):
     """Displays a live sinfo-style partition summary table."""
 
+    HEADER_ID = "partitions-header"
+
     BINDINGS = [
         Binding("s", "sort_partition", show=False),
         Binding("n", "sort_nodes", show=False),
@@ -69,7 +95,7 @@ class PartitionsView(BaseDataTableView[ClusterSummary]):
         return [(name, w) for name, w in COLUMNS if name not in self._hidden_cols]
 
     def _rebuild_columns(self) -> None:
-        table = self.query_one(CyclicDataTable)
+        table = self._data_table()
         table.clear(columns=True)
         for name, width in self._visible_cols_filtered():
             table.add_column(name, width=width)
@@ -94,7 +120,10 @@ class PartitionsView(BaseDataTableView[ClusterSummary]):
         super()._set_sort(col)
         config.update({"view_state": {"partitions_sort_col": self._sort_col or "", "partitions_sort_reversed": self._sort_reversed}})
         self._last_sorted_rows = self._sorted_rows(self._last_summaries)
-        self._render_rows(self._last_sorted_rows)
+        self._last_render_fp = _render_fp(self._last_sorted_rows)
+        with self.app.batch_update():
+            self._render_rows(self._last_sorted_rows)
+            self._touch_header_time()
 
     def action_sort_partition(self) -> None:
         self._set_sort("partition")
@@ -102,40 +131,42 @@ class PartitionsView(BaseDataTableView[ClusterSummary]):
     def action_sort_nodes(self) -> None:
         self._set_sort("nodes")
 
+    def _data_signature(self, data: list[ClusterSummary]) -> object | None:
+        return hash(tuple(
+            (s.partition, s.avail, s.timelimit, s.nodes, s.state, s.nodelist) for s in data
+        ))
+
     def _update_table(self, summaries: list[ClusterSummary]) -> None:
         self._last_summaries = summaries
         self._last_sorted_rows = self._sorted_rows(summaries)
 
-        now = datetime.now().strftime("%H:%M:%S")
         up = sum(1 for s in summaries if s.avail.lower() == "up")
-        self.query_one("#partitions-header", Label).update(
+        self._header_parts = (
             f"[b]sinfo[/b]  [green]{up} up[/]  "
-            f"[dim]{len(summaries)} partitions  updated {now}[/]"
+            f"[dim]{len(summaries)} partitions  updated ",
+            "[/]",
         )
-
-        new_fp = tuple((s.partition, s.state, s.nodes) for s in self._last_sorted_rows)
+        new_fp = _render_fp(self._last_sorted_rows)
         if new_fp == self._last_render_fp:
+            self._touch_header_time()
             return
         self._last_render_fp = new_fp
 
-        state = self._capture_table_state()
-        self._render_rows(self._last_sorted_rows)
-        self._restore_table_state(state, self._last_sorted_rows)
+        with self.app.batch_update():
+            state = self._capture_table_state()
+            self._render_rows(self._last_sorted_rows)
+            self._restore_table_state(state, self._last_sorted_rows)
+            self._touch_header_time()
 
     def _sorted_rows(self, summaries: list[ClusterSummary]) -> list[ClusterSummary]:
-        rows = list(summaries)
         if self._sort_col == "partition":
-            rows = sorted(rows, key=lambda s: s.partition, reverse=self._sort_reversed)
-        elif self._sort_col == "nodes":
-            rows = sorted(
-                rows,
-                key=lambda s: int(s.nodes) if s.nodes.isdigit() else 0,
-                reverse=self._sort_reversed,
-            )
-        return rows
+            return sorted(summaries, key=attrgetter("partition"), reverse=self._sort_reversed)
+        if self._sort_col == "nodes":
+            return sorted(summaries, key=_node_count, reverse=self._sort_reversed)
+        return list(summaries)
 
     def _capture_table_state(self) -> tuple[int, float, str | None]:
-        table = self.query_one(CyclicDataTable)
+        table = self._data_table()
         row = table.cursor_row
         scroll_y = float(table.scroll_offset.y)
         anchor: str | None = None
@@ -149,7 +180,7 @@ class PartitionsView(BaseDataTableView[ClusterSummary]):
         if not rows:
             return
         saved_row, scroll_y, anchor = state
-        table = self.query_one(CyclicDataTable)
+        table = self._data_table()
         row = None
         if anchor:
             for i, summary in enumerate(rows):
@@ -162,26 +193,23 @@ class PartitionsView(BaseDataTableView[ClusterSummary]):
         table.scroll_to(y=scroll_y, animate=False)
 
     def _cell_for_col(self, s: ClusterSummary, name: str) -> str:
-        avail_color = AVAIL_COLORS.get(s.avail.lower(), "white")
-        state_lower = s.state.lower().split("*")[0].rstrip("-")
-        state_color = STATE_COLORS.get(state_lower, "white")
         if name == "PARTITION":
             return f"[bold]{s.partition}[/bold]"
         if name == "AVAIL":
-            return f"[{avail_color}]{s.avail}[/]"
+            return _avail_cell(s.avail)
         if name == "TIMELIMIT":
             return s.timelimit
         if name == "NODES":
             return s.nodes
         if name == "STATE":
-            return f"[{state_color}]{s.state}[/]"
+            return _state_cell(s.state)
         return s.nodelist
 
     def _render_rows(self, sorted_rows: list[ClusterSummary]) -> None:
         visible = self._visible_cols_filtered()
-        table = self.query_one(CyclicDataTable)
+        rows = [[self._cell_for_col(s, name) for name, _ in visible] for s in sorted_rows]
+        table = self._data_table()
         table.clear()
-        for s in sorted_rows:
-            table.add_row(*[self._cell_for_col(s, name) for name, _ in visible])
+        table.add_rows(rows)
         if sorted_rows and table.cursor_row < 0:
             table.move_cursor(row=0)
@@ -8,13 +8,15 @@ class CyclicDataTable(DataTable):
     """DataTable whose cursor wraps from last row to first and vice versa."""
 
     def action_cursor_up(self) -> None:
-        if self.row_count and self.cursor_row == 0:
-            self.move_cursor(row=self.row_count - 1)
+        row_count = self.row_count
+        if row_count and self.cursor_row == 0:
+            self.move_cursor(row=row_count - 1)
         else:
             super().action_cursor_up()
 
     def action_cursor_down(self) -> None:
-        if self.row_count and self.cursor_row >= self.row_count - 1:
+        row_count = self.row_count
+        if row_count and self.cursor_row >= row_count - 1:
             self.move_cursor(row=0)
         else:
             super().action_cursor_down()
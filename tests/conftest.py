@@ -5,11 +5,21 @@ import pytest
 from sqtop import slurm, config
 
 
+@pytest.fixture(autouse=True)
+def _reset_slurm_caches(monkeypatch):
+    """Keep the short-lived sinfo/scontrol caches from leaking output between tests."""
+    monkeypatch.setattr(slurm, "_SINFO_CACHE", None)
+    monkeypatch.setattr(slurm, "_DETAIL_CACHE", {})
+    monkeypatch.setattr(slurm, "_FIRST_NODE_CACHE", {})
+
+
 @pytest.fixture
 def mock_run(monkeypatch):
-    """Return a factory that monkeypatches slurm._run to return controlled output."""
+    """Return a factory that monkeypatches slurm._run/_run_fast/_run_lines to return controlled output."""
     def factory(output: str) -> None:
         monkeypatch.setattr(slurm, "_run", lambda cmd: output)
+        monkeypatch.setattr(slurm, "_run_fast", lambda cmd: output)
+        monkeypatch.setattr(slurm, "_run_lines", lambda cmd: iter(output.splitlines(keepends=True)))
     return factory
 
 
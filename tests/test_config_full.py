@@ -1,42 +1,16 @@
-"""Extended config.py tests — _toml_escape, malformed TOML, partial sections."""
+"""Extended config.py tests — escaping, malformed TOML, partial sections."""
 from __future__ import annotations
 
 import pytest
 from sqtop import config
 
 
-# ── _toml_escape ─────────────────────────────────────────────────────────────
+# ── string escaping on write ─────────────────────────────────────────────────
 
-def test_toml_escape_backslash():
-    assert config._toml_escape("a\\b") == "a\\\\b"
-
-
-def test_toml_escape_double_quote():
-    assert config._toml_escape('a"b') == 'a\\"b'
-
-
-def test_toml_escape_combined():
-    """Input a\\\"b (a, backslash, quote, b) — correct TOML escaping (backslash first).
-
-    Correct escaping (backslash first, then quote):
-      step 1 — replace \\ with \\\\: a, \\\\, ", b  →  a + 2 backslashes + quote + b
-      step 2 — replace " with \\": a, \\\\, \\", b  →  a + 2 backslashes + backslash-quote + b
-    TOML decode: a + (\\\\ = \\) + (\\" = ") + b = a, \\, ", b  (original string restored)
-    """
-    result = config._toml_escape('a\\"b')  # input: a, \, ", b
-    assert result == 'a\\\\\\"b'  # a + 2 backslashes + backslash-quote + b
-
-
-def test_toml_escape_no_special_chars():
-    assert config._toml_escape("hello world") == "hello world"
-
-
-def test_toml_escape_only_backslash():
-    assert config._toml_escape("\\") == "\\\\"
-
-
-def test_toml_escape_only_quote():
-    assert config._toml_escape('"') == '\\"'
+@pytest.mark.parametrize("value", ['a\\b', 'a"b', 'a\\"b', "hello world", "\\", '"'])
+def test_write_round_trips_special_chars(temp_config, value):
+    config.update({"attach": {"default_command": value}})
+    assert config.load()["attach"]["default_command"] == value
 
 
 # ── load with malformed TOML ──────────────────────────────────────────────────
@@ -93,3 +67,66 @@ def test_update_top_level_key(temp_config):
     config.update({"interval": 10.0})
     cfg = config.load()
     assert cfg["interval"] == 10.0
+
+
+# ── load caching ──────────────────────────────────────────────────────────────
+
+def test_load_returns_independent_copies(temp_config):
+    (temp_config / "config.toml").write_text('theme = "nord"\n', encoding="utf-8")
+    first = config.load()
+    first["jobs"]["name_max"] = 999
+    second = config.load()
+    assert second["jobs"]["name_max"] == 24
+
+
+def test_load_sees_changes_after_update(temp_config):
+    (temp_config / "config.toml").write_text('theme = "nord"\n', encoding="utf-8")
+    assert config.load()["theme"] == "nord"
+    config.update({"theme": "gruvbox"})
+    assert config.load()["theme"] == "gruvbox"
+
+
+# ── debounced writes ──────────────────────────────────────────────────────────
+
+async def test_updates_in_event_loop_are_coalesced(temp_config, monkeypatch):
+    writes = []
+    real_write = config._write
+    monkeypatch.setattr(config, "_write", lambda cfg: (writes.append(cfg), real_write(cfg)))
+    config.update({"jobs": {"name_max": 30}})
+    config.update({"jobs": {"user_max": 8}})
+    config.save("nord", 5.0)
+    assert writes == []
+    cfg = config.load()
+    assert (cfg["jobs"]["name_max"], cfg["jobs"]["user_max"], cfg["theme"]) == (30, 8, "nord")
+    config.flush()
+    assert len(writes) == 1
+    assert not (temp_config / "config.toml.tmp").exists()
+    on_disk = config._load_file()
+    assert (on_disk["jobs"]["name_max"], on_disk["jobs"]["user_max"], on_disk["interval"]) == (30, 8, 5.0)
+
+
+def test_load_after_write_skips_reparse(temp_config, monkeypatch):
+    config.update({"jobs": {"name_max": 40}})
+
+    def _no_parse(_f):
+        raise AssertionError("config re-parsed after write")
+
+    monkeypatch.setattr(config.tomllib, "load", _no_parse)
+    assert config.load()["jobs"]["name_max"] == 40
+
+
+def test_write_keeps_file_mode(temp_config):
+    config._write({})
+    (temp_config / "config.toml").chmod(0o600)
+    config._write({"theme": "nord"})
+    assert (temp_config / "config.toml").stat().st_mode & 0o777 == 0o600
+
+
+def test_write_failure_removes_temp_file(temp_config, monkeypatch):
+    def _fail(*_args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(config.os, "fsync", _fail)
+    with pytest.raises(OSError):
+        config._write({})
+    assert not (temp_config / "config.toml.tmp").exists()
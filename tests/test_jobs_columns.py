@@ -61,3 +61,170 @@ def test_jobs_columns_rebuild_after_empty_transition(monkeypatch, temp_config):
     second_name_width = dict(view._current_cols)["NAME"]
 
     assert second_name_width > first_name_width
+
+
+def test_jobs_column_width_capped_by_max_len(monkeypatch, temp_config):
+    view = JobsView()
+    monkeypatch.setattr(view, "query_one", lambda *args, **kwargs: _FakeTable())
+    view._col_max["NAME"] = 10
+
+    view._rebuild_columns(200, [_job("x" * 50), _job("short")], force=True)
+
+    # Cells truncate to 10 characters and the column never grows past that.
+    assert dict(view._current_cols)["NAME"] == 10
+
+
+class _FakeRowTable(_FakeTable):
+    cursor_row = 0
+
+    def __init__(self) -> None:
+        self.rows: list[list] = []
+        self.keys: list[str | None] = []
+        self.ops: list[str] = []
+
+    def clear(self, columns: bool = False) -> None:
+        self.ops.append("clear")
+        self.rows, self.keys = [], []
+
+    def add_row(self, *cells: str, key: str | None = None) -> None:
+        self.ops.append("add")
+        self.rows.append(list(cells))
+        self.keys.append(key)
+
+    def remove_row(self, key: str) -> None:
+        self.ops.append("remove")
+        idx = self.keys.index(key)
+        del self.rows[idx], self.keys[idx]
+
+    def update_cell_at(self, coordinate, value: str) -> None:
+        self.ops.append("update")
+        self.rows[coordinate.row][coordinate.column] = value
+
+    def add_column(self, name: str, width: int) -> str:
+        self.ops.append("add_column")
+        for row in self.rows:
+            row.append("")
+        return name
+
+    def remove_column(self, key: str) -> None:
+        self.ops.append("remove_column")
+        # Columns are only ever dropped from the end, one key at a time.
+        for row in self.rows:
+            row.pop()
+
+    def move_cursor(self, row: int) -> None:
+        return
+
+
+def test_render_rows_reuses_cells_for_unchanged_jobs(monkeypatch, temp_config):
+    view = JobsView()
+    table = _FakeRowTable()
+    monkeypatch.setattr(view, "query_one", lambda *args, **kwargs: table)
+    view._rebuild_columns(200, [_job("a")], force=True)
+
+    job = _job("a")
+    view._render_rows([job])
+    first = view._row_cache[job.job_id][1]
+    view._render_rows([_job("a")])
+    assert view._row_cache[job.job_id][1] is first
+
+    changed = _job("a")
+    changed.state = "COMPLETING"
+    view._render_rows([changed])
+    assert view._row_cache[job.job_id][1] is not first
+    assert any("COMPLETING" in cell for cell in table.rows[0])
+
+
+def test_render_rows_patches_table_in_place(monkeypatch, temp_config):
+    view = JobsView()
+    table = _FakeRowTable()
+    monkeypatch.setattr(view, "query_one", lambda *args, **kwargs: table)
+    view._rebuild_columns(200, [_job("a")], force=True)
+
+    def jobs(*specs: tuple[str, str]) -> list[Job]:
+        out = []
+        for job_id, state in specs:
+            job = _job("a")
+            job.job_id, job.state = job_id, state
+            out.append(job)
+        return out
+
+    view._render_rows(jobs(("1", "RUNNING"), ("2", "RUNNING"), ("3", "PENDING")))
+    table.ops.clear()
+    view._render_rows(jobs(("1", "RUNNING"), ("3", "COMPLETING"), ("4", "PENDING")))
+    assert "clear" not in table.ops
+    assert table.keys == ["1", "3", "4"]
+
+    rebuilt = _FakeRowTable()
+    view._table = rebuilt
+    view._row_cache = {}
+    view._render_rows(jobs(("1", "RUNNING"), ("3", "COMPLETING"), ("4", "PENDING")))
+    assert table.rows == rebuilt.rows
+
+    # A reorder falls back to a full rebuild.
+    table.ops.clear()
+    view._table = table
+    view._render_rows(jobs(("4", "PENDING"), ("1", "RUNNING")))
+    assert table.ops[0] == "clear"
+    assert table.keys == ["4", "1"]
+
+
+def test_render_rows_keeps_duplicate_job_ids_distinct(temp_config):
+    view = JobsView()
+    table = _FakeRowTable()
+    view._table = table
+    view._rebuild_columns(200, [_job("a")], force=True)
+
+    view._render_rows([_job("first"), _job("second")])
+    assert [row[1] for row in table.rows] == ["[green]first[/]", "[green]second[/]"]
+
+
+def test_rebuild_columns_patches_trailing_columns(monkeypatch, temp_config):
+    view = JobsView()
+    table = _FakeRowTable()
+    monkeypatch.setattr(view, "query_one", lambda *args, **kwargs: table)
+    jobs = [_job("a")]
+    view._rebuild_columns(200, jobs, force=True)
+    view._render_rows(jobs)
+    wide = [list(row) for row in table.rows]
+
+    for width in (60, 200):
+        table.ops.clear()
+        view._rebuild_columns(width, jobs)
+        view._render_rows(jobs)
+        assert "clear" not in table.ops
+        assert all(len(row) == len(view._current_cols) for row in table.rows)
+    assert table.rows == wide
+
+
+def test_search_index_built_once_per_job_list(temp_config):
+    view = JobsView()
+    jobs = [_job("Train-Model"), _job("eval")]
+    jobs[1].job_id = "678"
+
+    index = view._search_index(jobs)
+    assert view._search_index(jobs) is index
+    assert [j.name for j, text in zip(jobs, index) if "train" in text] == ["Train-Model"]
+    assert [j.job_id for j, text in zip(jobs, index) if "678" in text] == ["678"]
+    # Fields are separated, so a query cannot span the end of one and start of the next.
+    assert not any("modelrunning" in text for text in index)
+    assert view._search_index(list(jobs)) is not index
+
+
+def test_data_signature_tracks_job_fields(temp_config):
+    view = JobsView()
+    assert view._data_signature([_job("a")]) == view._data_signature([_job("a")])
+    later = _job("a")
+    later.time_used = "00:02:12"
+    assert view._data_signature([later]) != view._data_signature([_job("a")])
+
+
+def test_visible_cols_prefix_matches_thresholds():
+    from sqtop.views import jobs, nodes
+
+    for module in (jobs, nodes):
+        thresholds = [min_term_w for _, _, min_term_w in module.COLUMNS]
+        assert thresholds == sorted(thresholds)
+        for width in range(0, 200, 5):
+            expected = [(name, w) for name, w, min_term_w in module.COLUMNS if min_term_w <= width]
+            assert list(module._visible_cols(width)) == expected
@@ -21,6 +21,10 @@ def test_format_bindings_pretty_keys_and_desc():
     assert rows[3] == ("/", "Search")
 
 
+def test_format_bindings_names_undescribed_tab_switches():
+    assert format_bindings([Binding("2", "switch_nodes", show=False)]) == [("2", "Switch tab")]
+
+
 class _DummyView(BaseDataTableView[int]):
     def _fetch_data(self) -> list[int]:
         return []
@@ -0,0 +1,66 @@
+"""Regression tests for the nodes table rendering."""
+from __future__ import annotations
+
+from sqtop.slurm import Node
+from sqtop.views.nodes import NodesView
+
+
+class _FakeTable:
+    cursor_row = 0
+
+    def __init__(self) -> None:
+        self.rows: list[list[str]] = []
+        self.ops: list[str] = []
+
+    def clear(self, columns: bool = False) -> None:
+        self.ops.append("clear")
+        self.rows = []
+
+    def add_column(self, name: str, width: int) -> None:
+        return
+
+    def add_rows(self, rows) -> None:
+        self.ops.append("add_rows")
+        self.rows.extend(list(row) for row in rows)
+
+    def update_cell_at(self, coordinate, value: str) -> None:
+        self.ops.append("update")
+        self.rows[coordinate.row][coordinate.column] = value
+
+    def move_cursor(self, row: int) -> None:
+        return
+
+
+def _node(name: str, state: str = "idle", cpus_alloc: str = "0") -> Node:
+    return Node(
+        name=name,
+        state=state,
+        partition="compute",
+        cpus_total="8",
+        cpus_alloc=cpus_alloc,
+        memory_total="64000",
+        memory_free="32000",
+    )
+
+
+def test_render_rows_patches_changed_cells_in_place(temp_config):
+    view = NodesView()
+    table = _FakeTable()
+    view._table = table
+    view._rebuild_columns(200)
+
+    view._render_rows([_node("n1"), _node("n2")])
+    table.ops.clear()
+    view._render_rows([_node("n1"), _node("n2", "mixed", "4")])
+    assert "clear" not in table.ops
+    assert 0 < table.ops.count("update") < len(view._current_cols)
+
+    fresh = _FakeTable()
+    view._table = fresh
+    view._rebuild_columns(200)
+    view._render_rows([_node("n1"), _node("n2", "mixed", "4")])
+    assert table.rows == fresh.rows
+
+    # A different node set refills the table.
+    view._render_rows([_node("n2", "mixed", "4")])
+    assert fresh.ops[-1] == "add_rows" and len(fresh.rows) == 1
@@ -17,3 +17,50 @@ def test_run_bulk_job_action_aggregates(monkeypatch):
     results = slurm.run_bulk_job_action("cancel", ["1", "2", "3"])
     assert len(results) == 3
     assert sum(1 for r in results if r.ok) == 2
+
+
+def test_run_bulk_job_action_runs_concurrently_in_order(monkeypatch):
+    import threading
+    import time
+
+    barrier = threading.Barrier(3, timeout=2)
+
+    def fake_run_job_action(action: str, job_id: str):
+        barrier.wait()  # only passes if all three calls are in flight together
+        time.sleep(0.01 * (3 - int(job_id)))
+        return slurm.ActionResult(job_id=job_id, action=action, ok=True)
+
+    monkeypatch.setattr(slurm, "_run_command", lambda cmd: None)  # batch could not launch
+    monkeypatch.setattr(slurm, "run_job_action", fake_run_job_action)
+    results = slurm.run_bulk_job_action("hold", ["1", "2", "3"])
+    assert [r.job_id for r in results] == ["1", "2", "3"]
+
+
+def test_run_bulk_job_action_batches_into_one_call(monkeypatch):
+    calls: list[str] = []
+
+    def fake_run_command(cmd: str):
+        calls.append(cmd)
+        return "", False, "scancel: error: Kill job error on job id 12: Invalid job id specified"
+
+    monkeypatch.setattr(slurm, "_run_command", fake_run_command)
+    results = slurm.run_bulk_job_action("cancel", ["11", "12", "13"])
+    assert calls == ["scancel 11 12 13"]
+    assert [(r.job_id, r.ok) for r in results] == [("11", True), ("12", False), ("13", True)]
+    assert "Invalid job id" in results[1].message
+
+
+def test_run_bulk_job_action_scontrol_uses_comma_list(monkeypatch):
+    calls: list[str] = []
+    monkeypatch.setattr(slurm, "_run_command", lambda cmd: (calls.append(cmd), ("", True, ""))[1])
+    results = slurm.run_bulk_job_action("Release", ["5", "6_1"])
+    assert calls == ["scontrol release 5,6_1"]
+    assert all(r.ok and r.action == "release" for r in results)
+
+
+def test_run_bulk_job_action_unattributed_failure_is_not_replayed(monkeypatch):
+    calls: list[str] = []
+    monkeypatch.setattr(slurm, "_run_command", lambda cmd: (calls.append(cmd), ("", False, "timeout"))[1])
+    results = slurm.run_bulk_job_action("requeue", ["7", "8"])
+    assert calls == ["scontrol requeue 7,8"]
+    assert [(r.ok, r.message) for r in results] == [(False, "timeout"), (False, "timeout")]
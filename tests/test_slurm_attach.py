@@ -8,6 +8,14 @@ def test_resolve_first_node_uses_scontrol_hostnames(monkeypatch):
     assert slurm.resolve_first_node("c[1-2]") == "c1"
 
 
+def test_resolve_first_node_reuses_successful_expansion(monkeypatch):
+    calls: list[str] = []
+    monkeypatch.setattr(slurm, "_run", lambda cmd: (calls.append(cmd), "c1\nc2\n")[1])
+    assert slurm.resolve_first_node("c[1-2]") == "c1"
+    assert slurm.resolve_first_node("c[1-2]") == "c1"
+    assert len(calls) == 1
+
+
 def test_resolve_first_node_falls_back_when_scontrol_fails(monkeypatch):
     monkeypatch.setattr(slurm, "_run", lambda cmd: "")
     assert slurm.resolve_first_node("c1,c2,c3") == "c1"
@@ -26,6 +26,25 @@ def test_fetch_jobs_normal(mock_run):
     assert j.qos == "normal"
 
 
+def test_fetch_jobs_shares_repeated_field_strings(mock_run):
+    mock_run(
+        "1|a|alice|RUNNING|gpu|1|4|0:01|8:00:00|None|node01|normal\n"
+        "2|b|alice|RUNNING|gpu|1|4|0:01|8:00:00|None|node02|normal\n"
+    )
+    a, b = slurm.fetch_jobs()
+    assert a.user is b.user
+    assert a.state is b.state
+    assert a.partition is b.partition
+
+
+def test_fetch_jobs_numeric_id(mock_run):
+    mock_run(
+        "123|a|alice|RUNNING|gpu|1|4|0:01|8:00:00|None|node01|normal\n"
+        "77_[1-4]|b|alice|PENDING|gpu|1|4|0:00|8:00:00|None||normal\n"
+    )
+    assert [j.numeric_id for j in slurm.fetch_jobs()] == [123, 0]
+
+
 def test_fetch_jobs_empty(mock_run):
     mock_run("")
     assert slurm.fetch_jobs() == []
@@ -102,7 +121,7 @@ def test_fetch_gpus_alloc_no_gpu_node(mock_run):
 
 def test_fetch_nodes_normal(monkeypatch):
     sinfo_out = "node01|idle|gpu|4|4/0/0/4|32000|28000|0.10|gpu:2\n"
-    monkeypatch.setattr(slurm, "_run", lambda cmd: sinfo_out)
+    monkeypatch.setattr(slurm, "_run_fast", lambda cmd: sinfo_out)
     monkeypatch.setattr(slurm, "_fetch_gpus_alloc", lambda: {"node01": 1})
     nodes = slurm.fetch_nodes()
     assert len(nodes) == 1
@@ -119,7 +138,7 @@ def test_fetch_nodes_cpu_parts_fallback(monkeypatch):
     """When cpu_parts has wrong length, cpus_total and cpus_alloc should both be '?'."""
     # cpu field is "8" (not slash-separated), so cpu_parts length will be 1, not 4
     sinfo_out = "node01|idle|gpu|4|8|32000|28000|0.10|(null)\n"
-    monkeypatch.setattr(slurm, "_run", lambda cmd: sinfo_out)
+    monkeypatch.setattr(slurm, "_run_fast", lambda cmd: sinfo_out)
     monkeypatch.setattr(slurm, "_fetch_gpus_alloc", lambda: {})
     nodes = slurm.fetch_nodes()
     assert len(nodes) == 1
@@ -130,7 +149,9 @@ def test_fetch_nodes_cpu_parts_fallback(monkeypatch):
 # ── fetch_cluster_summary ────────────────────────────────────────────────────
 
 def test_fetch_cluster_summary_normal(mock_run):
-    mock_run("gpu|up|8:00:00|4|idle|node[01-04]\n")
+    mock_run("".join(
+        f"node{i:02d}|idle|gpu|4|0/4/0/4|32000|28000|0.10|gpu:2|up|8:00:00|1|node{i:02d}\n" for i in range(1, 5)
+    ))
     summaries = slurm.fetch_cluster_summary()
     assert len(summaries) == 1
     s = summaries[0]
@@ -147,6 +168,61 @@ def test_fetch_cluster_summary_empty(mock_run):
     assert slurm.fetch_cluster_summary() == []
 
 
+def test_fetch_cluster_summary_groups_by_partition_and_state(mock_run):
+    mock_run(
+        "node01|idle|gpu|4|0/4/0/4|32000|28000|0.10|gpu:2|up|8:00:00|1|node01\n"
+        "node02|mixed|gpu|4|2/2/0/4|32000|28000|0.10|gpu:2|up|8:00:00|1|node02\n"
+        "node03|idle|gpu|4|0/4/0/4|32000|28000|0.10|gpu:2|up|8:00:00|1|node03\n"
+        "node03|idle|cpu|4|0/4/0/4|32000|28000|0.10|(null)|up|1-00:00:00|1|node03\n"
+    )
+    rows = [(s.partition, s.state, s.nodes, s.nodelist) for s in slurm.fetch_cluster_summary()]
+    assert rows == [
+        ("gpu", "idle", "2", "node[01,03]"),
+        ("gpu", "mixed", "1", "node02"),
+        ("cpu", "idle", "1", "node03"),
+    ]
+
+
+def test_fetch_cluster_summary_uses_node_names_and_keeps_empty_partitions(monkeypatch):
+    monkeypatch.setattr(slurm, "_fetch_gpus_alloc", lambda: {})
+    mock_out = (
+        "host-a|idle|gpu|4|0/4/0/4|32000|28000|0.10|gpu:2|up|8:00:00|1|node01\n"
+        "n/a|n/a|spare|0|0/0/0/0|0|0|N/A|(null)|up|infinite|0|\n"
+    )
+    monkeypatch.setattr(slurm, "_run_fast", lambda cmd: mock_out)
+    rows = [(s.partition, s.nodes, s.nodelist) for s in slurm.fetch_cluster_summary()]
+    assert rows == [("gpu", "1", "node01"), ("spare", "0", "")]
+    assert [n.name for n in slurm.fetch_nodes()] == ["host-a"]
+
+
+def test_fetch_cluster_summary_counts_merged_rows(mock_run):
+    mock_run(
+        "node|idle|gpu|4|0/4/0/4|32000|28000|0.10|gpu:2|up|8:00:00|2|node[01-02]\n"
+        "node03|idle|gpu|4|0/4/0/4|32000|28000|0.10|gpu:2|up|8:00:00|1|node03\n"
+    )
+    rows = [(s.nodes, s.nodelist) for s in slurm.fetch_cluster_summary()]
+    assert rows == [("3", "node[01-03]")]
+
+
+def test_sinfo_shared_between_nodes_and_summary(monkeypatch):
+    calls: list[str] = []
+    line = "node01|idle|gpu|4|0/4/0/4|32000|28000|0.10|gpu:2|up|8:00:00|1|node01\n"
+    monkeypatch.setattr(slurm, "_run_fast", lambda cmd: (calls.append(cmd), line)[1])
+    monkeypatch.setattr(slurm, "_fetch_gpus_alloc", lambda: {})
+    slurm.fetch_nodes()
+    slurm.fetch_cluster_summary()
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("names,expected", [
+    (["node01", "node02", "node03", "node07"], "node[01-03,07]"),
+    (["node9", "node10"], "node[9-10]"),
+    (["gpu1", "login", "gpu2"], "gpu[1-2],login"),
+])
+def test_compress_hostlist(names, expected):
+    assert slurm._compress_hostlist(names) == expected
+
+
 # ── fetch_job_detail / fetch_node_detail ─────────────────────────────────────
 
 def test_fetch_job_detail_parses_kv(mock_run):
@@ -166,6 +242,26 @@ def test_fetch_node_detail_skips_no_equals(mock_run):
     assert "SOMETOKEN" not in detail
 
 
+def test_fetch_job_detail_cached_until_action(monkeypatch, mock_run_result):
+    calls: list[str] = []
+    monkeypatch.setattr(slurm, "_run", lambda cmd: (calls.append(cmd), "JobId=123 JobState=PENDING\n")[1])
+    slurm.fetch_job_detail("123")
+    slurm.fetch_log_paths("123")
+    assert len(calls) == 1
+    mock_run_result(stdout="", ok=True, stderr="")
+    slurm.hold_job_result("123")
+    slurm.fetch_job_detail("123")
+    assert len(calls) == 2
+
+
+def test_fetch_job_detail_does_not_cache_failed_lookup(monkeypatch):
+    calls: list[str] = []
+    monkeypatch.setattr(slurm, "_run", lambda cmd: (calls.append(cmd), "")[1])
+    assert slurm.fetch_job_detail("123") == {}
+    assert slurm.fetch_job_detail("123") == {}
+    assert len(calls) == 2
+
+
 # ── hold / release / requeue ─────────────────────────────────────────────────
 
 def test_hold_job_result_ok(mock_run_result):
@@ -214,6 +310,16 @@ def test_tail_log_file_empty_output(mock_run):
     assert result == "(empty or file not found)"
 
 
+def test_tail_log_file_reads_local_file_in_process(tmp_path, monkeypatch):
+    def no_run(cmd):
+        raise AssertionError("tail subprocess should not run for a local file")
+
+    monkeypatch.setattr(slurm, "_run", no_run)
+    log = tmp_path / "job.out"
+    log.write_text("".join(f"line {i}\n" for i in range(1000)))
+    assert slurm.tail_log_file(str(log), n=3) == "line 997\nline 998\nline 999\n"
+
+
 # ── _run_result exception handling ───────────────────────────────────────────
 
 def test_run_result_timeout(monkeypatch):
@@ -244,3 +350,80 @@ def test_run_result_oserror(monkeypatch):
     out, ok, stderr = slurm._run_result("squeue --noheader")
     assert out == ""
     assert ok is False
+
+
+# ── _run_lines streaming ─────────────────────────────────────────────────────
+
+def test_run_lines_yields_output_and_records_stat():
+    import sys
+    cmd = f"{sys.executable} -c 'print(1); print(2)'"
+    assert list(slurm._run_lines(cmd)) == ["1\n", "2\n"]
+    stat = slurm.fetch_command_health(1)[0]
+    assert stat.command == cmd
+    assert stat.ok is True
+
+
+def test_run_lines_command_not_found():
+    assert list(slurm._run_lines("sqtop-no-such-command --noheader")) == []
+    stat = slurm.fetch_command_health(1)[0]
+    assert stat.ok is False
+    assert stat.stderr == "command not found"
+
+
+def test_run_lines_early_stop_is_not_recorded(monkeypatch):
+    import sys
+    monkeypatch.setattr(slurm, "_COMMAND_HISTORY", slurm.deque(maxlen=300))
+    lines = slurm._run_lines([sys.executable, "-c", "print(1); print(2)"])
+    assert next(lines) == "1\n"
+    lines.close()
+    assert slurm.fetch_command_health(10) == []
+
+
+def test_run_lines_drains_large_stderr():
+    import sys
+    script = "import sys; sys.stderr.write('x' * 200000); print(1)"
+    cmd = [sys.executable, "-c", script]
+    start = slurm.monotonic()
+    assert list(slurm._run_lines(cmd)) == ["1\n"]
+    assert slurm.monotonic() - start < 5
+    assert slurm.fetch_command_health(1)[0].ok is True
+
+
+def test_run_lines_raises_after_failed_exit():
+    import sys
+    lines = slurm._run_lines([sys.executable, "-c", "print(1); raise SystemExit(2)"])
+    assert next(lines) == "1\n"
+    with pytest.raises(subprocess.CalledProcessError):
+        next(lines)
+
+
+def test_fetch_jobs_drops_partial_output(monkeypatch):
+    def cut_short(cmd):
+        yield "1|a|alice|RUNNING|gpu|1|4|0:01|8:00:00|None|node01|normal\n"
+        raise subprocess.CalledProcessError(-9, cmd)
+    monkeypatch.setattr(slurm, "_run_lines", cut_short)
+    assert slurm.fetch_jobs() == []
+
+
+def test_run_fast_samples_successes_but_keeps_failures(monkeypatch):
+    monkeypatch.setattr(slurm, "_COMMAND_HISTORY", slurm.deque(maxlen=300))
+    monkeypatch.setattr(slurm, "_fast_calls", slurm.count())
+    for _ in range(slurm._FAST_SAMPLE_EVERY):
+        assert slurm._run_fast("echo ok") == "ok\n"
+    slurm._run_fast("sqtop-no-such-command")
+    stats = slurm.fetch_command_health(100)
+    assert [s.ok for s in stats] == [True, False]
+    assert stats[-1].stderr == "command not found"
+
+
+def test_run_result_replaces_undecodable_bytes():
+    out, ok, _ = slurm._run_result("printf 'ok\\377job'")
+    assert ok is True
+    assert out == "ok�job"
+
+
+def test_command_argv_accepts_prebuilt_list(monkeypatch):
+    argv = ["squeue", "--noheader", "-o", "%i|%j"]
+    assert slurm._command_argv(argv) == argv
+    monkeypatch.setattr(slurm, "_SSH_HOST", "cluster")
+    assert slurm._command_argv(argv)[-2:] == ["cluster", "squeue --noheader -o '%i|%j'"]